@@ -85,6 +85,7 @@ from shared_ai_utils.config import (
     ConfigManager,
     PresetManager,
     get_preset,
+    get_preset_view,
     list_presets,
     load_config,
     save_config,
@@ -135,6 +136,7 @@ __all__ = [
     "ConfigManager",
     "PresetManager",
     "get_preset",
+    "get_preset_view",
     "list_presets",
     "load_config",
     "save_config",
@@ -12,6 +12,7 @@ from shared_ai_utils.config.base import ConfigBase
 from shared_ai_utils.config.presets import (
     PresetManager,
     get_preset,
+    get_preset_view,
     list_presets,
 )
 from shared_ai_utils.config.yaml import ConfigManager, load_config, save_config
@@ -23,6 +24,7 @@ __all__ = [
     "save_config",
     "PresetManager",
     "get_preset",
+    "get_preset_view",
     "list_presets",
     "SonoPlatformConfigAdapter",
     "SonoEvalConfigAdapter",
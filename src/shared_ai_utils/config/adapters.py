@@ -14,6 +14,9 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C loader; fall back to the pure-Python one
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class SonoPlatformConfigAdapter:
     """Adapter for sono-platform settings.yaml format."""
@@ -35,7 +38,7 @@ class SonoPlatformConfigAdapter:
 
         try:
             with open(path, "r") as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=_LOADER) or {}
         except Exception as e:
             logger.error(f"Failed to load settings.yaml: {e}")
             return {}
@@ -122,7 +125,7 @@ class SonoEvalConfigAdapter:
                 try:
                     if config_file.endswith(".yaml") or config_file.endswith(".yml"):
                         with open(file_path, "r") as f:
-                            config.update(yaml.safe_load(f) or {})
+                            config.update(yaml.load(f, Loader=_LOADER) or {})
                     elif config_file.endswith(".json"):
                         import json
 
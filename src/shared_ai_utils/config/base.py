@@ -4,6 +4,8 @@ Base Configuration Class
 Pydantic BaseSettings-based configuration that can be extended by applications.
 """
 
+import functools
+import operator
 import os
 from pathlib import Path
 from typing import Any, Optional
@@ -52,6 +54,12 @@ except ImportError:
     pass
 
 
+@functools.lru_cache(maxsize=256)
+def _path_getter(key: str) -> operator.attrgetter:
+    """Compile a dot-notation key into a reusable attribute getter."""
+    return operator.attrgetter(key)
+
+
 class ConfigBase(BaseSettings):
     """Base configuration class using Pydantic BaseSettings.
 
@@ -69,6 +77,8 @@ class ConfigBase(BaseSettings):
         env_file=".env",
         case_sensitive=False,
         extra="ignore",
+        # set() assigns attributes directly; keep that off the validator path
+        validate_assignment=False,
     )
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -81,6 +91,13 @@ class ConfigBase(BaseSettings):
         Returns:
             Configuration value or default
         """
+        # Fast path: the whole key resolves through attributes
+        try:
+            return _path_getter(key)(self)
+        except AttributeError:
+            pass
+
+        # Slow path: walk parts so nested dicts are supported
         parts = key.split(".")
         value = self
 
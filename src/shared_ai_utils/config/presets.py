@@ -4,7 +4,10 @@ Configuration Presets
 Predefined configuration presets for common use cases.
 """
 
-from typing import Any, Dict, Optional
+import functools
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 
 # Standard presets from sono-eval
@@ -91,6 +94,11 @@ STANDARD_PRESETS = {
     },
 }
 
+# Read-only snapshot of the built-in presets, shared by every PresetManager
+_BUILTIN_PRESETS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {name: MappingProxyType(dict(values)) for name, values in STANDARD_PRESETS.items()}
+)
+
 PRESET_DESCRIPTIONS = {
     "quick_test": "Fast setup for quick testing (minimal features, fast startup)",
     "development": "Full-featured development environment (all features enabled)",
@@ -106,13 +114,24 @@ PRESET_DESCRIPTIONS = {
 }
 
 
+# Bumped whenever PRESET_DESCRIPTIONS or a custom preset changes; list_presets caches key off it
+_presets_generation = 0
+
+
+def _bump_generation() -> None:
+    global _presets_generation
+    _presets_generation += 1
+    get_preset_view.cache_clear()
+
+
 class PresetManager:
     """Manages configuration presets."""
 
     def __init__(self):
         """Initialize preset manager."""
-        self.presets: Dict[str, Dict[str, Any]] = STANDARD_PRESETS.copy()
+        self.presets: Mapping[str, Mapping[str, Any]] = _BUILTIN_PRESETS
         self.custom_presets: Dict[str, Dict[str, Any]] = {}
+        self._cached_list: Optional[Tuple[int, Mapping[str, str]]] = None
 
     def get_preset(self, preset_name: str) -> Dict[str, Any]:
         """Get configuration preset values.
@@ -127,7 +146,7 @@ class PresetManager:
             ValueError: If preset not found
         """
         if preset_name in self.presets:
-            return self.presets[preset_name].copy()
+            return dict(self.presets[preset_name])
         if preset_name in self.custom_presets:
             return self.custom_presets[preset_name].copy()
 
@@ -145,11 +164,28 @@ class PresetManager:
         Returns:
             Dictionary mapping preset names to descriptions
         """
+        return dict(self.list_presets_view())
+
+    def list_presets_view(self) -> Mapping[str, str]:
+        """Get a cached, read-only view of preset names and descriptions.
+
+        Unlike list_presets(), repeated calls return the same object until a preset
+        is saved or deleted.
+
+        Returns:
+            Read-only mapping of preset names to descriptions
+        """
+        cached = self._cached_list
+        if cached is not None and cached[0] == _presets_generation:
+            return cached[1]
+
         result = PRESET_DESCRIPTIONS.copy()
         # Add custom presets
         for name in self.custom_presets:
             result[name] = f"Custom preset: {name}"
-        return result
+        view = MappingProxyType(result)
+        self._cached_list = (_presets_generation, view)
+        return view
 
     def save_preset(self, name: str, values: Dict[str, Any], description: Optional[str] = None):
         """Save a custom preset.
@@ -159,9 +195,15 @@ class PresetManager:
             values: Configuration values
             description: Optional description
         """
-        self.custom_presets[name] = values.copy()
+        # Custom presets arrive from YAML/user input; intern their keys like the built-in literals
+        if type(name) is str:
+            name = sys.intern(name)
+        self.custom_presets[name] = {
+            sys.intern(key) if type(key) is str else key: value for key, value in values.items()
+        }
         if description:
             PRESET_DESCRIPTIONS[name] = description
+        _bump_generation()
 
     def delete_preset(self, name: str):
         """Delete a custom preset.
@@ -177,6 +219,7 @@ class PresetManager:
         del self.custom_presets[name]
         if name in PRESET_DESCRIPTIONS:
             del PRESET_DESCRIPTIONS[name]
+        _bump_generation()
 
 
 # Global preset manager instance
@@ -198,6 +241,21 @@ def get_preset(preset_name: str) -> Dict[str, Any]:
     return _preset_manager.get_preset(preset_name)
 
 
+@functools.lru_cache(maxsize=16)
+def get_preset_view(preset_name: str) -> Mapping[str, Any]:
+    """Get a cached, read-only view of configuration preset values.
+
+    Unlike get_preset(), repeated lookups return the same object without copying.
+
+    Args:
+        preset_name: Name of the preset
+
+    Returns:
+        Read-only mapping of configuration values
+    """
+    return MappingProxyType(get_preset(preset_name))
+
+
 def list_presets() -> Dict[str, str]:
     """List all available configuration presets.
 
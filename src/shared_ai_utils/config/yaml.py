@@ -14,6 +14,10 @@ from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C bindings; fall back to the pure-Python implementations
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class ConfigManager:
     """Manages loading and saving configuration from YAML files."""
@@ -67,7 +71,7 @@ class ConfigManager:
         if self.path.exists():
             try:
                 with open(self.path, encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
+                    data = yaml.load(f, Loader=_LOADER) or {}
                 # Create config instance, allowing YAML data to override defaults
                 self.config = config_class(**data)
                 logger.debug(f"Loaded config from {self.path}")
@@ -93,6 +97,7 @@ class ConfigManager:
                 yaml.dump(
                     config.model_dump(exclude_none=True),
                     f,
+                    Dumper=_DUMPER,
                     default_flow_style=False,
                     sort_keys=False,
                 )
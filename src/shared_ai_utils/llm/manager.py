@@ -28,8 +28,8 @@ class LLMManager:
         Args:
             preferred_provider: Preferred provider name ("anthropic", "openai", "gemini")
         """
-        self.providers: Dict[str, LLMProvider] = {}
-        self._initialize_providers()
+        # Built on first use; constructing providers probes env vars and SDK imports
+        self._provider_map: Optional[Dict[str, LLMProvider]] = None
 
         self.preferred_provider = preferred_provider or os.environ.get(
             "LLM_PROVIDER", "anthropic"
@@ -38,8 +38,21 @@ class LLMManager:
             f"LLM Manager initialized with preferred provider: {self.preferred_provider}"
         )
 
-    def _initialize_providers(self):
+    @property
+    def providers(self) -> Dict[str, LLMProvider]:
+        """Available providers by name, detected on first access."""
+        if self._provider_map is None:
+            self._provider_map = self._initialize_providers()
+        return self._provider_map
+
+    @providers.setter
+    def providers(self, providers: Dict[str, LLMProvider]) -> None:
+        """Replace the provider map, skipping detection."""
+        self._provider_map = providers
+
+    def _initialize_providers(self) -> Dict[str, LLMProvider]:
         """Initialize all available providers."""
+        providers: Dict[str, LLMProvider] = {}
         provider_classes = [
             (AnthropicProvider, "anthropic"),
             (OpenAIProvider, "openai"),
@@ -50,11 +63,13 @@ class LLMManager:
             try:
                 provider = provider_class()
                 if provider.is_available():
-                    self.providers[provider_name] = provider
+                    providers[provider_name] = provider
                     logger.info(f"Provider {provider_name} is available")
             except Exception as e:
                 logger.debug(f"Could not initialize {provider_class.__name__}: {e}")
 
+        return providers
+
     async def generate(
         self,
         system_prompt: str,
@@ -115,9 +130,19 @@ class LLMManager:
 
         raise RuntimeError("All LLM providers failed")
 
+    def refresh(self) -> None:
+        """Re-detect available providers.
+
+        Availability is probed once, on first use; call this after API keys
+        or installed packages change.
+        """
+        self._provider_map = None
+
     def list_available_providers(self) -> List[str]:
         """Get list of available provider names.
 
+        Uses the availability detected on first use or after the last refresh().
+
         Returns:
             List of provider names
         """
@@ -21,6 +21,16 @@ from pydantic import BaseModel, Field
 logger = logging.getLogger(__name__)
 
 
+def _env_key(*names: str) -> Optional[str]:
+    """Return the first non-empty environment variable among names."""
+    environ = os.environ
+    for name in names:
+        value = environ.get(name)
+        if value:
+            return value
+    return None
+
+
 @dataclass
 class LLMResponse:
     """Unified response from any LLM provider with token tracking."""
@@ -208,7 +218,7 @@ class AnthropicProvider(LLMProvider):
     ):
         """Initialize Anthropic provider."""
         super().__init__(
-            api_key or os.environ.get("ANTHROPIC_API_KEY"),
+            api_key or _env_key("ANTHROPIC_API_KEY"),
             model=model,
             base_url=base_url,
         )
@@ -346,19 +356,13 @@ class OpenAIProvider(LLMProvider):
     ):
         """Initialize OpenAI provider."""
         # Try OpenAI key first, then Vercel AI Gateway key
-        resolved_key = (
-            api_key or os.environ.get("OPENAI_API_KEY") or os.environ.get("AI_GATEWAY_API_KEY")
-        )
+        openai_key = _env_key("OPENAI_API_KEY")
+        gateway_key = None if openai_key else _env_key("AI_GATEWAY_API_KEY")
+        resolved_key = api_key or openai_key or gateway_key
 
         # If using Vercel AI Gateway, set the base URL
-        if (
-            not base_url
-            and os.environ.get("AI_GATEWAY_API_KEY")
-            and not os.environ.get("OPENAI_API_KEY")
-        ):
-            base_url = (
-                base_url or os.environ.get("VERCEL_AI_GATEWAY_URL") or "https://api.vercel.ai/v1"
-            )
+        if not base_url and gateway_key:
+            base_url = _env_key("VERCEL_AI_GATEWAY_URL") or "https://api.vercel.ai/v1"
 
         super().__init__(
             resolved_key,
@@ -515,9 +519,8 @@ class GeminiProvider(LLMProvider):
     ):
         """Initialize Gemini provider."""
         # Check GEMINI_API_KEY first, then fall back to GOOGLE_API_KEY
-        env_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
         super().__init__(
-            api_key or env_key,
+            api_key or _env_key("GEMINI_API_KEY", "GOOGLE_API_KEY"),
             model=model,
             base_url=base_url,
         )
@@ -629,11 +632,9 @@ class HTTPProvider(LLMProvider):
         base_url: Optional[str] = None,
     ):
         """Initialize HTTP provider."""
-        resolved_api_key = (
-            api_key or os.environ.get("HTTP_API_KEY") or os.environ.get("COUNCIL_API_KEY")
-        )
+        resolved_api_key = api_key or _env_key("HTTP_API_KEY", "COUNCIL_API_KEY")
         super().__init__(resolved_api_key, model=model, base_url=base_url)
-        self.endpoint = endpoint or base_url or os.environ.get("LLM_ENDPOINT")
+        self.endpoint = endpoint or base_url or _env_key("LLM_ENDPOINT")
         if not self.endpoint:
             raise ValueError("HTTP endpoint required. Set LLM_ENDPOINT or pass endpoint.")
 
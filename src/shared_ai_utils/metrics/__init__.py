@@ -1,12 +1,14 @@
 """Unified metrics collection framework for cross-repo usage."""
 
 from shared_ai_utils.metrics.collector import (
+    AssessmentEntry,
     MetricsCollector,
     MetricType,
     get_metric_categories,
 )
 
 __all__ = [
+    "AssessmentEntry",
     "MetricsCollector",
     "MetricType",
     "get_metric_categories",
@@ -11,13 +11,24 @@ Supports:
 
 import json
 import logging
+import sys
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
 
+def _intern(value: Any) -> Any:
+    """Intern plain str values repeated across retained entries; pass others through.
+
+    str subclasses (e.g. ``(str, Enum)`` members) and None cannot be interned.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
 class MetricType(str, Enum):
     """Types of metrics supported by the unified framework."""
 
@@ -63,8 +74,60 @@ class MetricType(str, Enum):
     DEPLOYMENT_ISSUE = "deployment_issue"
 
 
+@dataclass
+class AssessmentEntry:
+    """A logged assessment event.
+
+    Stored with __slots__ instead of a per-entry dict; item access
+    (entry["overall_score"]) is kept for compatibility with dict entries.
+    """
+
+    __slots__ = (
+        "candidate_id",
+        "assessment_id",
+        "overall_score",
+        "path_scores",
+        "processing_time_ms",
+        "metadata",
+        "timestamp",
+    )
+
+    candidate_id: str
+    assessment_id: str
+    overall_score: float
+    path_scores: List[Dict[str, Any]]
+    processing_time_ms: float
+    metadata: Dict[str, Any]
+    timestamp: str
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field by name, like dict.get."""
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class MetricsCollector:
-    """Unified metrics collector supporting all metric types across repositories."""
+    """Unified metrics collector supporting all metric types across repositories.
+
+    Note:
+        ``data`` maps each category to a ``collections.deque`` (bounded by
+        ``max_entries_per_category``), and assessments are stored as
+        ``AssessmentEntry`` records rather than dicts. Code that sliced the former
+        lists or passed ``data`` to ``json.dumps`` should use
+        ``get_metrics_by_type()``, ``export_dict()`` or ``export_json()``, which
+        return plain lists of dicts.
+    """
 
     # Extended metric categories for cross-repo support
     METRIC_CATEGORIES = [
@@ -99,17 +162,31 @@ class MetricsCollector:
         "deployment_issues",
     ]
 
-    def __init__(self, memory_service: Optional[Any] = None):
+    def __init__(
+        self,
+        memory_service: Optional[Any] = None,
+        max_entries_per_category: Optional[int] = None,
+    ):
         """Initialize the metrics collector.
 
         Args:
             memory_service: Optional memory service for persistence (e.g., MemU)
+            max_entries_per_category: Keep only the most recent entries per category
+                (None keeps everything)
         """
-        self.data: Dict[str, List[Dict[str, Any]]] = {
-            category: [] for category in self.METRIC_CATEGORIES
-        }
+        self.max_entries_per_category = max_entries_per_category
+        self.data: Dict[str, Deque[Union[Dict[str, Any], AssessmentEntry]]] = self._empty_data()
         self.memory_service = memory_service
 
+    def _empty_data(self) -> Dict[str, Deque[Any]]:
+        """Create empty per-category entry buffers.
+
+        Deques append without reallocating, and drop the oldest entries once
+        max_entries_per_category is reached.
+        """
+        maxlen = self.max_entries_per_category
+        return {category: deque(maxlen=maxlen) for category in self.METRIC_CATEGORIES}
+
     @classmethod
     def get_metric_categories(cls) -> List[str]:
         """Get the list of metric categories.
@@ -140,16 +217,17 @@ class MetricsCollector:
             processing_time_ms: Processing time in milliseconds
             metadata: Optional additional metadata
         """
-        entry = {
-            "candidate_id": candidate_id,
-            "assessment_id": assessment_id,
-            "overall_score": overall_score,
-            "path_scores": path_scores,
-            "processing_time_ms": processing_time_ms,
-            "metadata": metadata or {},
-            "timestamp": datetime.now().isoformat(),
-        }
-        self.data["assessments"].append(entry)
+        self.data["assessments"].append(
+            AssessmentEntry(
+                candidate_id,
+                assessment_id,
+                overall_score,
+                path_scores,
+                processing_time_ms,
+                metadata or {},
+                datetime.now().isoformat(),
+            )
+        )
         logger.debug(f"Logged assessment: {assessment_id}")
 
     def log_assessment_score(
@@ -315,7 +393,7 @@ class MetricsCollector:
             metadata: Optional additional metadata
         """
         entry = {
-            "method": method,
+            "method": _intern(method),
             "path": path,
             "status_code": status_code,
             "response_time_ms": response_time_ms,
@@ -510,8 +588,8 @@ class MetricsCollector:
             metadata: Optional additional metadata
         """
         entry = {
-            "provider": provider,
-            "model": model,
+            "provider": _intern(provider),
+            "model": _intern(model),
             "success": success,
             "duration_ms": duration_ms,
             "token_count": token_count,
@@ -560,7 +638,7 @@ class MetricsCollector:
         Returns:
             JSON string of all metrics
         """
-        return json.dumps(self.data, indent=2)
+        return json.dumps(self.export_dict(), indent=2)
 
     def export_dict(self) -> Dict[str, List[Dict[str, Any]]]:
         """Export all collected metrics as dictionary.
@@ -568,7 +646,13 @@ class MetricsCollector:
         Returns:
             Dictionary of all metrics
         """
-        return self.data.copy()
+        return {
+            category: [
+                entry.to_dict() if isinstance(entry, AssessmentEntry) else entry
+                for entry in entries
+            ]
+            for category, entries in self.data.items()
+        }
 
     def get_summary(self) -> Dict[str, int]:
         """Get a summary count of all metrics.
@@ -582,7 +666,7 @@ class MetricsCollector:
 
     def clear(self) -> None:
         """Clear all collected metrics."""
-        self.data = {category: [] for category in self.METRIC_CATEGORIES}
+        self.data = self._empty_data()
         logger.debug("Cleared all metrics")
 
     def get_metrics_by_type(self, metric_type: MetricType) -> List[Dict[str, Any]]:
@@ -611,7 +695,10 @@ class MetricsCollector:
         }
         category = category_map.get(metric_type)
         if category:
-            return self.data.get(category, [])
+            return [
+                entry.to_dict() if isinstance(entry, AssessmentEntry) else entry
+                for entry in self.data.get(category, ())
+            ]
         return []
 
 
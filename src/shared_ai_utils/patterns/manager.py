@@ -4,49 +4,101 @@ Pattern Manager
 Manages pattern library with CRUD operations, versioning, and effectiveness tracking.
 """
 
+import io
 import json
 import logging
 import os
+import re
 import uuid
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional, Set, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Pattern IDs are drawn from a pool refilled by one urandom read per batch
+_ID_BATCH_SIZE = 128
+_ID_POOL: List[str] = []
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not hand out the same IDs as its parent
+    os.register_at_fork(after_in_child=_ID_POOL.clear)
+
+
+def _next_id() -> str:
+    """Return a new random (version 4) UUID string."""
+    try:
+        return _ID_POOL.pop()
+    except IndexError:
+        buf = os.urandom(16 * _ID_BATCH_SIZE)
+        _ID_POOL.extend(
+            str(uuid.UUID(bytes=buf[i : i + 16], version=4)) for i in range(0, len(buf), 16)
+        )
+        return _ID_POOL.pop()
+
+
+def _tokenize(text: str) -> Set[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return set(_TOKEN_RE.findall(text.lower()))
+
 
 class PatternManager:
     """Manages pattern library with CRUD operations and archiving."""
 
     def __init__(
         self,
-        pattern_library_path: str = "patterns.json",
+        pattern_library_path: Union[str, Path, IO] = "patterns.json",
         use_memory: bool = False,
         memory_service: Optional[Any] = None,
     ):
         """Initialize the pattern manager.
 
         Args:
-            pattern_library_path: Path to the pattern library JSON file
+            pattern_library_path: Path to the pattern library JSON file, or an open
+                file-like object (e.g. io.StringIO) to read and write in place
             use_memory: Whether to enable MemU integration
             memory_service: Optional memory service instance
         """
-        # Validate path to prevent path traversal
-        if ".." in Path(pattern_library_path).parts:
-            raise ValueError(f"Path traversal detected in: {pattern_library_path}")
+        # File-like libraries are used as-is; there is no path to validate or open
+        self._stream: Optional[IO] = None
+        if hasattr(pattern_library_path, "read"):
+            self._stream = pattern_library_path
+            self.pattern_library_path = str(getattr(pattern_library_path, "name", "<stream>"))
+        else:
+            # Validate path to prevent path traversal
+            if ".." in Path(pattern_library_path).parts:
+                raise ValueError(f"Path traversal detected in: {pattern_library_path}")
 
-        resolved_path = Path(pattern_library_path).resolve()
-        self.pattern_library_path = str(resolved_path)
+            resolved_path = Path(pattern_library_path).resolve()
+            self.pattern_library_path = str(resolved_path)
 
         self.patterns: List[Dict[str, Any]] = []
         self.changelog: List[Dict[str, Any]] = []
 
+        # Lookup indexes kept in sync with self.patterns by the mutating methods:
+        # pattern_id -> first pattern with that id, and token/tag -> {id(pattern): pattern}
+        # for suggestions (keyed by identity so patterns without or sharing an id still match)
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._token_index: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self._tag_index: Dict[str, Dict[int, Dict[str, Any]]] = {}
+
         # Memory integration
         self.use_memory = use_memory
         self.memory = memory_service
 
         # Try to load existing patterns
-        if os.path.exists(self.pattern_library_path):
+        if self._stream is not None:
+            if self._stream.seek(0, io.SEEK_END):
+                self.load_patterns()
+        elif os.path.exists(self.pattern_library_path):
             self.load_patterns()
         else:
             logger.debug(
@@ -56,10 +108,16 @@ class PatternManager:
     def load_patterns(self) -> None:
         """Load patterns from JSON file."""
         try:
-            with open(self.pattern_library_path, "r") as f:
-                data = json.load(f)
-                self.patterns = data.get("patterns", [])
-                self.changelog = data.get("changelog", [])
+            if self._stream is not None:
+                self._stream.seek(0)
+                raw = self._stream.read()
+            else:
+                with open(self.pattern_library_path, "rb") as f:
+                    raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self.patterns = data.get("patterns", [])
+            self.changelog = data.get("changelog", [])
+            self._rebuild_index()
             logger.debug(
                 f"Loaded {len(self.patterns)} patterns from {self.pattern_library_path}"
             )
@@ -67,6 +125,7 @@ class PatternManager:
             logger.debug(f"Failed to load patterns: {e}")
             self.patterns = []
             self.changelog = []
+            self._rebuild_index()
 
     def save_patterns(self) -> None:
         """Save patterns to JSON file."""
@@ -76,8 +135,19 @@ class PatternManager:
                 "changelog": self.changelog,
                 "last_updated": datetime.now().isoformat(),
             }
-            with open(self.pattern_library_path, "w") as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2).encode("utf-8")
+            if self._stream is not None:
+                self._stream.seek(0)
+                self._stream.truncate()
+                if isinstance(self._stream, io.TextIOBase):
+                    payload = payload.decode("utf-8")
+                self._stream.write(payload)
+            else:
+                with open(self.pattern_library_path, "wb") as f:
+                    f.write(payload)
             logger.debug(
                 f"Saved {len(self.patterns)} patterns to {self.pattern_library_path}"
             )
@@ -110,26 +180,70 @@ class PatternManager:
         Returns:
             Created pattern dictionary
         """
-        pattern = {
-            "pattern_id": str(uuid.uuid4()),
-            "name": name,
-            "description": description,
-            "good_example": good_example,
-            "bad_example": bad_example or "",
-            "severity": severity,
-            "tags": tags or [],
-            "occurrence_frequency": 0,
-            "effectiveness_score": 0.5,
-            "created_at": datetime.now().isoformat(),
-            "last_occurrence": None,
-        }
+        pattern = self._build_pattern(
+            name=name,
+            description=description,
+            good_example=good_example,
+            bad_example=bad_example,
+            severity=severity,
+            tags=tags,
+            timestamp=datetime.now().isoformat(),
+        )
 
         self.patterns.append(pattern)
+        self._index_pattern(pattern)
         self._add_changelog_entry("added", name)
         logger.info(f"Added pattern: {name}")
 
         return pattern
 
+    def add_patterns_bulk(
+        self, items: List[Dict[str, Any]], save: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Add many patterns at once.
+
+        All patterns share a single creation timestamp and the library is
+        written at most once, instead of once per pattern.
+
+        Args:
+            items: Pattern specs with the same keys as ``add_pattern`` arguments
+                (``name``, ``description``, ``good_example`` required)
+            save: Persist the library once after all patterns are added
+
+        Returns:
+            List of created pattern dictionaries
+        """
+        timestamp = datetime.now().isoformat()
+        created = []
+
+        for spec in items:
+            pattern = self._build_pattern(
+                name=spec["name"],
+                description=spec["description"],
+                good_example=spec["good_example"],
+                bad_example=spec.get("bad_example"),
+                severity=spec.get("severity", "medium"),
+                tags=spec.get("tags"),
+                timestamp=timestamp,
+            )
+            self.patterns.append(pattern)
+            self._index_pattern(pattern)
+            self.changelog.append(
+                {
+                    "action": "added",
+                    "pattern_name": pattern["name"],
+                    "timestamp": timestamp,
+                }
+            )
+            created.append(pattern)
+
+        logger.info(f"Added {len(created)} patterns")
+
+        if save and created:
+            self.save_patterns()
+
+        return created
+
     def update_pattern(
         self,
         pattern_id: str,
@@ -155,7 +269,9 @@ class PatternManager:
             return None
 
         if description is not None:
+            self._unindex_pattern(pattern)
             pattern["description"] = description
+            self._index_pattern(pattern)
         if good_example is not None:
             pattern["good_example"] = good_example
         if bad_example is not None:
@@ -182,6 +298,8 @@ class PatternManager:
             return False
 
         self.patterns.remove(pattern)
+        self._unindex_pattern(pattern)
+        self._forget_id(pattern)
         self._add_changelog_entry("removed", pattern["name"])
         logger.info(f"Removed pattern: {pattern['name']}")
 
@@ -241,30 +359,24 @@ class PatternManager:
         Returns:
             List of suggested patterns
         """
-        # Simple keyword-based suggestion (can be enhanced with semantic search)
-        context_lower = context.lower()
-        suggestions = []
-
-        for pattern in self.patterns:
-            if pattern.get("archived", False):
-                continue
-
-            name = pattern.get("name", "").lower()
-            description = pattern.get("description", "").lower()
-            tags = [tag.lower() for tag in pattern.get("tags", [])]
-
-            # Simple matching
-            if (
-                any(word in name for word in context_lower.split())
-                or any(word in description for word in context_lower.split())
-                or any(tag in context_lower for tag in tags)
-            ):
-                suggestions.append(pattern)
-
-            if len(suggestions) >= limit:
-                break
-
-        return suggestions
+        # Keyword-based suggestion via the inverted indexes (can be enhanced with
+        # semantic search): rank patterns by matched query tokens, then effectiveness
+        overlap: Counter = Counter()
+        candidates: Dict[int, Dict[str, Any]] = {}
+        for token in _tokenize(context):
+            for index in (self._token_index, self._tag_index):
+                for key, pattern in index.get(token, {}).items():
+                    overlap[key] += 1
+                    candidates[key] = pattern
+
+        ranked = sorted(
+            (pattern for pattern in candidates.values() if not pattern.get("archived", False)),
+            key=lambda pattern: (
+                -overlap[id(pattern)],
+                -pattern.get("effectiveness_score", 0.5),
+            ),
+        )
+        return ranked[:limit]
 
     def get_pattern_effectiveness(self, pattern_id: str) -> Optional[float]:
         """Get effectiveness score for a pattern.
@@ -275,8 +387,8 @@ class PatternManager:
         Returns:
             Effectiveness score (0.0-1.0) or None
         """
-        pattern = self._find_pattern_by_id(pattern_id)
-        if not pattern:
+        pattern = self._by_id.get(pattern_id)
+        if pattern is None:
             return None
         return pattern.get("effectiveness_score", 0.5)
 
@@ -292,8 +404,8 @@ class PatternManager:
         Returns:
             True if updated, False if not found
         """
-        pattern = self._find_pattern_by_id(pattern_id)
-        if not pattern:
+        pattern = self._by_id.get(pattern_id)
+        if pattern is None:
             return False
 
         pattern["effectiveness_score"] = max(0.0, min(1.0, score))
@@ -302,12 +414,89 @@ class PatternManager:
 
         return True
 
+    @staticmethod
+    def _build_pattern(
+        name: str,
+        description: str,
+        good_example: str,
+        bad_example: Optional[str],
+        severity: str,
+        tags: Optional[List[str]],
+        timestamp: str,
+    ) -> Dict[str, Any]:
+        """Build a new pattern dictionary."""
+        return {
+            "pattern_id": _next_id(),
+            "name": name,
+            "description": description,
+            "good_example": good_example,
+            "bad_example": bad_example or "",
+            "severity": severity,
+            "tags": tags or [],
+            "occurrence_frequency": 0,
+            "effectiveness_score": 0.5,
+            "created_at": timestamp,
+            "last_occurrence": None,
+        }
+
+    @staticmethod
+    def _index_terms(pattern: Dict[str, Any]) -> Tuple[Set[str], Set[str]]:
+        """Return the (token index, tag index) terms for a pattern."""
+        tokens = _tokenize(pattern.get("name") or "") | _tokenize(
+            pattern.get("description") or ""
+        )
+        tags = set()
+        for tag in pattern.get("tags") or ():
+            tags |= _tokenize(tag)
+        return tokens, tags
+
+    def _index_pattern(self, pattern: Dict[str, Any]) -> None:
+        """Add a pattern to the lookup indexes."""
+        pattern_id = pattern.get("pattern_id")
+        if pattern_id is not None:
+            # Like a scan of self.patterns, ID lookups return the first match
+            self._by_id.setdefault(pattern_id, pattern)
+        key = id(pattern)
+        tokens, tags = self._index_terms(pattern)
+        for token in tokens:
+            self._token_index.setdefault(token, {})[key] = pattern
+        for tag in tags:
+            self._tag_index.setdefault(tag, {})[key] = pattern
+
+    def _unindex_pattern(self, pattern: Dict[str, Any]) -> None:
+        """Remove a pattern from the suggestion indexes."""
+        key = id(pattern)
+        tokens, tags = self._index_terms(pattern)
+        for index, terms in ((self._token_index, tokens), (self._tag_index, tags)):
+            for term in terms:
+                postings = index.get(term)
+                if postings is not None:
+                    postings.pop(key, None)
+                    if not postings:
+                        del index[term]
+
+    def _forget_id(self, pattern: Dict[str, Any]) -> None:
+        """Drop a removed pattern from the ID index, promoting any duplicate."""
+        pattern_id = pattern.get("pattern_id")
+        if self._by_id.get(pattern_id) is not pattern:
+            return
+        del self._by_id[pattern_id]
+        for other in self.patterns:
+            if other.get("pattern_id") == pattern_id:
+                self._by_id[pattern_id] = other
+                break
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the lookup indexes from self.patterns."""
+        self._by_id = {}
+        self._token_index = {}
+        self._tag_index = {}
+        for pattern in self.patterns:
+            self._index_pattern(pattern)
+
     def _find_pattern_by_id(self, pattern_id: str) -> Optional[Dict[str, Any]]:
         """Find pattern by ID."""
-        for pattern in self.patterns:
-            if pattern.get("pattern_id") == pattern_id:
-                return pattern
-        return None
+        return self._by_id.get(pattern_id)
 
     def _find_pattern_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Find pattern by name."""
@@ -336,10 +525,14 @@ class PatternManager:
             logger.debug("Memory service not enabled")
             return 0
 
-        synced_count = 0
-        for pattern in self.patterns:
-            if await self.memory.memorize_pattern(pattern):
-                synced_count += 1
+        if hasattr(self.memory, "memorize_patterns"):
+            responses = await self.memory.memorize_patterns(self.patterns)
+            synced_count = sum(1 for response in responses if response)
+        else:
+            synced_count = 0
+            for pattern in self.patterns:
+                if await self.memory.memorize_pattern(pattern):
+                    synced_count += 1
 
         logger.info(f"Synced {synced_count}/{len(self.patterns)} patterns to memory")
         return synced_count
@@ -4,13 +4,183 @@ Pattern Memory Integration
 MemU integration for semantic pattern storage and retrieval.
 """
 
+import asyncio
+import copy
+import importlib.util
 import logging
 import os
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# NumPy backs the semantic recommendation cache (disabled without it). Only its
+# presence is checked at import; the module is loaded on first cache use.
+_NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+np = None
+
+
+def _load_numpy() -> None:
+    """Import NumPy into the module namespace on first use."""
+    global np
+    if np is None:
+        import numpy
+
+        np = numpy
+
+
+# Maximum number of query embeddings kept per PatternMemory instance
+EMBEDDING_CACHE_SIZE = 1024
+
+# Semantic recommendation cache settings
+SEMANTIC_CACHE_SIZE = 1024
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def _quantize(vector: "np.ndarray") -> Tuple["np.ndarray", float]:
+    """Quantize a float vector to int8 with a single symmetric scale."""
+    peak = float(np.abs(vector).max())
+    scale = peak / 127.0 if peak > 0.0 else 1.0
+    return np.round(vector / scale).astype(np.int8), scale
+
+
+def _cosine_scores_numpy(matrix, scales, norms, query_q8, query_scale, query_norm):
+    """Cosine similarity of an int8 query against int8 rows (NumPy)."""
+    dots = matrix @ query_q8.astype(np.int32)
+    return dots * scales * query_scale / (norms * query_norm)
+
+
+def _build_numba_kernel(numba):
+    """Compile the parallel int8 cosine kernel (called once, on first use)."""
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _cosine_scores_numba(matrix, scales, norms, query_q8, query_scale, query_norm):
+        """Cosine similarity of an int8 query against int8 rows (parallel, SIMD)."""
+        rows, dims = matrix.shape
+        sims = np.empty(rows, dtype=np.float32)
+        for i in numba.prange(rows):
+            acc = 0
+            for j in range(dims):
+                acc += np.int32(matrix[i, j]) * np.int32(query_q8[j])
+            sims[i] = acc * scales[i] * query_scale / (norms[i] * query_norm)
+        return sims
+
+    return _cosine_scores_numba
+
+
+# Similarity kernel, resolved on the first cache lookup so importing this module
+# never pays for loading Numba
+_cosine_scores = None
+
+
+def _get_cosine_scores():
+    """Return the Numba kernel if Numba is installed, else the NumPy version."""
+    global _cosine_scores
+    if _cosine_scores is None:
+        try:
+            import numba
+        except ImportError:  # Semantic cache scans fall back to NumPy
+            _cosine_scores = _cosine_scores_numpy
+        else:
+            _cosine_scores = _build_numba_kernel(numba)
+    return _cosine_scores
+
+
+class _SemanticCache:
+    """Cache of recommendation results keyed by query embedding similarity.
+
+    A lookup returns the results of the most similar cached query when its
+    cosine similarity meets the threshold and the entry has not expired.
+    Embeddings are stored as int8 rows with per-row scales, which cuts the
+    memory scanned per lookup by 4x compared to float32. Requires NumPy.
+    """
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl_seconds: float = SEMANTIC_CACHE_TTL_SECONDS,
+        max_entries: int = SEMANTIC_CACHE_SIZE,
+    ):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def clear(self) -> None:
+        """Drop all cached entries (e.g. after the pattern store changes)."""
+        self._matrix: Optional["np.ndarray"] = None  # (N, D) int8
+        self._scales: Optional["np.ndarray"] = None  # (N,) float32
+        self._norms: Optional["np.ndarray"] = None  # (N,) float32
+        self._results: List[List[Dict[str, Any]]] = []
+        self._limits: List[int] = []
+        self._timestamps: List[float] = []
+
+    def lookup(
+        self, vector: Sequence[float], limit: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for a near-duplicate query, if any."""
+        if self._matrix is None:
+            return None
+
+        query = np.asarray(vector, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query))
+        if query_norm == 0.0 or query.shape[0] != self._matrix.shape[1]:
+            return None
+
+        query_q8, query_scale = _quantize(query)
+        sims = _get_cosine_scores()(
+            self._matrix, self._scales, self._norms, query_q8, query_scale, query_norm
+        )
+        idx = int(np.argmax(sims))
+        if sims[idx] < self.threshold or self._limits[idx] < limit:
+            return None
+        if time.monotonic() - self._timestamps[idx] > self.ttl_seconds:
+            return None
+        # Copies, so one caller's edits don't leak into later hits
+        return [copy.copy(result) for result in self._results[idx][:limit]]
+
+    def store(
+        self, vector: Sequence[float], results: List[Dict[str, Any]], limit: int
+    ) -> None:
+        """Cache results for a query embedding."""
+        _load_numpy()
+        row = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(row))
+        if norm == 0.0:
+            return
+
+        row_q8, scale = _quantize(row)
+        if self._matrix is None or row.shape[0] != self._matrix.shape[1]:
+            # First entry (or embedding model changed): start a fresh matrix
+            self._matrix = row_q8[np.newaxis, :]
+            self._scales = np.array([scale], dtype=np.float32)
+            self._norms = np.array([norm], dtype=np.float32)
+            self._results, self._limits, self._timestamps = [], [], []
+        else:
+            self._matrix = np.vstack((self._matrix, row_q8))
+            self._scales = np.append(self._scales, np.float32(scale))
+            self._norms = np.append(self._norms, np.float32(norm))
+
+        self._results.append([copy.copy(result) for result in results])
+        self._limits.append(limit)
+        self._timestamps.append(time.monotonic())
+
+        overflow = len(self._results) - self.max_entries
+        if overflow > 0:
+            # Entries are appended in insertion order, so the oldest come first
+            self._matrix = self._matrix[overflow:]
+            self._scales = self._scales[overflow:]
+            self._norms = self._norms[overflow:]
+            del self._results[:overflow]
+            del self._limits[:overflow]
+            del self._timestamps[:overflow]
+
 
 class PatternMemory:
     """
@@ -42,15 +212,15 @@ class PatternMemory:
         self.db_url = db_url
         self._memory = None
         self._initialized = False
-        self._memu_available = False
-
-        # Try to import MemU
-        try:
-            import memu  # noqa: F401
-            self._memu_available = True
-            logger.info("MemU library loaded successfully")
-        except ImportError:
-            self._memu_available = False
+        self._embedding_cache: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self._semantic_cache: Optional[_SemanticCache] = (
+            _SemanticCache() if _NUMPY_AVAILABLE else None
+        )
+
+        # Only check that MemU is installed; the import itself is deferred to
+        # initialize() since it pulls in heavy dependencies
+        self._memu_available = importlib.util.find_spec("memu") is not None
+        if not self._memu_available:
             logger.warning(
                 "MemU library not available. Install with: pip install memu-py"
             )
@@ -129,23 +299,11 @@ class PatternMemory:
 
         try:
             # Prepare resource for MemU
-            resource = {
-                "type": "pattern",
-                "content": self._format_pattern_content(pattern),
-                "metadata": {
-                    "pattern_name": pattern.get("name", "unknown"),
-                    "pattern_id": pattern.get("pattern_id", ""),
-                    "severity": pattern.get("severity", "medium"),
-                    "occurrence_frequency": pattern.get("occurrence_frequency", 0),
-                    "effectiveness_score": pattern.get("effectiveness_score", 0.5),
-                    "timestamp": datetime.now().isoformat(),
-                    "source": "shared-ai-utils",
-                },
-                "tags": self._extract_tags(pattern),
-            }
+            resource = self._build_resource(pattern)
 
             # Store in MemU
             response = await self._memory.memorize(resource)
+            self._invalidate_recommendations()
             logger.debug(f"Stored pattern '{pattern.get('name')}' in MemU")
             return response
 
@@ -153,6 +311,82 @@ class PatternMemory:
             logger.error(f"Failed to memorize pattern: {e}")
             return None
 
+    async def memorize_patterns(
+        self,
+        patterns: List[Dict[str, Any]],
+        batch_size: int = 16,
+        max_concurrency: int = 5,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Store many patterns in MemU memory.
+
+        Patterns are sent in batches of ``batch_size``. A batch uses MemU's
+        ``memorize_batch`` when available, otherwise its items are stored
+        concurrently. At most ``max_concurrency`` batches are in flight at once.
+
+        If ``memorize_batch`` raises, the batch is retried item by item, so
+        patterns the backend stored before failing may be stored twice. If it
+        returns a different number of responses than patterns, they cannot be
+        matched to their inputs and the whole batch is reported as None.
+
+        Args:
+            patterns: Pattern dictionaries (see ``memorize_pattern``)
+            batch_size: Number of patterns per batch
+            max_concurrency: Maximum number of batches dispatched concurrently
+
+        Returns:
+            MemU responses in input order, with None for failed patterns
+        """
+        if not patterns:
+            return []
+
+        if not await self._ensure_initialized():
+            return [None] * len(patterns)
+
+        timestamp = datetime.now().isoformat()
+        resources = [self._build_resource(pattern, timestamp) for pattern in patterns]
+        batches = [
+            resources[i : i + batch_size] for i in range(0, len(resources), batch_size)
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        memorize_batch = getattr(self._memory, "memorize_batch", None)
+
+        async def _store(resource: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            try:
+                return await self._memory.memorize(resource)
+            except Exception as e:
+                logger.error(
+                    f"Failed to memorize pattern '{resource['metadata']['pattern_name']}': {e}"
+                )
+                return None
+
+        async def _store_batch(batch: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+            async with semaphore:
+                if memorize_batch is not None:
+                    try:
+                        stored = list(await memorize_batch(batch))
+                    except Exception as e:
+                        logger.warning(f"Batch memorize failed, storing individually: {e}")
+                    else:
+                        if len(stored) == len(batch):
+                            return stored
+                        logger.warning(
+                            f"Batch memorize returned {len(stored)} responses for "
+                            f"{len(batch)} patterns; discarding them to keep input order"
+                        )
+                        # Something may have been written even though it cannot be attributed
+                        self._invalidate_recommendations()
+                        return [None] * len(batch)
+                return list(await asyncio.gather(*(_store(r) for r in batch)))
+
+        results = await asyncio.gather(*(_store_batch(batch) for batch in batches))
+        responses = [response for batch in results for response in batch]
+        if any(response is not None for response in responses):
+            self._invalidate_recommendations()
+        logger.debug(
+            f"Stored {sum(r is not None for r in responses)}/{len(patterns)} patterns in MemU"
+        )
+        return responses
+
     async def retrieve_patterns(
         self, query: str, method: str = "rag", limit: int = 5
     ) -> Optional[Dict[str, Any]]:
@@ -172,9 +406,16 @@ class PatternMemory:
         try:
             # Query MemU with semantic search
             if method == "rag":
-                response = await self._memory.retrieve_rag(
-                    query=query, limit=limit, filters={"type": "pattern"}
-                )
+                if self._supports_vector_search():
+                    # Fast path: reuse cached query embeddings
+                    vector = await self._embed_query(query)
+                    response = await self._memory.search_by_vector(
+                        vector, limit=limit, filters={"type": "pattern"}
+                    )
+                else:
+                    response = await self._memory.retrieve_rag(
+                        query=query, limit=limit, filters={"type": "pattern"}
+                    )
             elif method == "llm":
                 response = await self._memory.retrieve_llm(
                     query=query, limit=limit, filters={"type": "pattern"}
@@ -207,34 +448,98 @@ class PatternMemory:
             return []
 
         try:
+            use_cache = self._semantic_cache is not None and self._supports_vector_search()
+            if use_cache:
+                # Near-duplicate contexts reuse earlier recommendations
+                vector = await self._embed_query(context)
+                cached = self._semantic_cache.lookup(vector, limit)
+                if cached is not None:
+                    logger.debug("Semantic cache hit for pattern recommendations")
+                    return cached
+
             # Use RAG retrieval for recommendations
             response = await self.retrieve_patterns(context, method="rag", limit=limit)
             if response and "results" in response:
-                return response["results"]
+                results = response["results"]
+                if use_cache:
+                    self._semantic_cache.store(vector, results, limit)
+                return results
             return []
 
         except Exception as e:
             logger.error(f"Failed to get pattern recommendations: {e}")
             return []
 
+    def _invalidate_recommendations(self) -> None:
+        """Forget cached recommendations once new patterns are stored."""
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+
+    def _supports_vector_search(self) -> bool:
+        """Check if MemU exposes separate embedding and vector search calls."""
+        return hasattr(self._memory, "embed_query") and hasattr(
+            self._memory, "search_by_vector"
+        )
+
+    async def _embed_query(self, query: str) -> Tuple[float, ...]:
+        """Embed a query, reusing cached embeddings for repeated queries."""
+        cached = self._embedding_cache.get(query)
+        if cached is not None:
+            self._embedding_cache.move_to_end(query)
+            return cached
+
+        vector = tuple(await self._memory.embed_query(query))
+        self._embedding_cache[query] = vector
+        if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+        return vector
+
+    def _build_resource(
+        self, pattern: Dict[str, Any], timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the MemU resource for a pattern.
+
+        Args:
+            pattern: Pattern dictionary
+            timestamp: ISO timestamp to record (defaults to now); batch callers
+                pass one shared value instead of formatting a new one per item
+        """
+        return {
+            "type": "pattern",
+            "content": self._format_pattern_content(pattern),
+            "metadata": {
+                "pattern_name": pattern.get("name", "unknown"),
+                "pattern_id": pattern.get("pattern_id", ""),
+                "severity": pattern.get("severity", "medium"),
+                "occurrence_frequency": pattern.get("occurrence_frequency", 0),
+                "effectiveness_score": pattern.get("effectiveness_score", 0.5),
+                "timestamp": timestamp or datetime.now().isoformat(),
+                "source": "shared-ai-utils",
+            },
+            "tags": self._extract_tags(pattern),
+        }
+
     def _format_pattern_content(self, pattern: Dict[str, Any]) -> str:
         """Format pattern content for MemU storage."""
+        good_example = pattern.get("good_example")
+        bad_example = pattern.get("bad_example")
         parts = [
             f"Pattern: {pattern.get('name', 'unknown')}",
             f"Description: {pattern.get('description', '')}",
         ]
 
-        if pattern.get("good_example"):
-            parts.append(f"Good Example:\n{pattern['good_example']}")
+        if good_example:
+            parts.append(f"Good Example:\n{good_example}")
 
-        if pattern.get("bad_example"):
-            parts.append(f"Bad Example:\n{pattern['bad_example']}")
+        if bad_example:
+            parts.append(f"Bad Example:\n{bad_example}")
 
         return "\n\n".join(parts)
 
     def _extract_tags(self, pattern: Dict[str, Any]) -> List[str]:
-        """Extract tags from pattern."""
-        tags = pattern.get("tags", [])
-        if pattern.get("severity"):
-            tags.append(f"severity:{pattern['severity']}")
-        return tags
+        """Extract tags from pattern (without mutating the pattern's own list)."""
+        tags = pattern.get("tags") or ()
+        severity = pattern.get("severity")
+        if severity:
+            return [*tags, f"severity:{severity}"]
+        return list(tags)
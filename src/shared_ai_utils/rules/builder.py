@@ -4,8 +4,10 @@ Rule Builder Module
 Assembles monolithic AGENT_KNOWLEDGE_BASE.md from modular rule files.
 """
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Standard header for the generated file
 HEADER = """# Global Agent Knowledge Base & Instructional Set
@@ -20,6 +22,37 @@ This document is the **Single Source of Truth** for all AI agents (Claude, Curso
 ---
 """
 
+# Pre-encoded header so the file output path never re-encodes it
+HEADER_BYTES = HEADER.encode("utf-8")
+
+# Separator appended after each rule section
+SECTION_SEPARATOR = "\n\n---\n"
+_SECTION_SUFFIX = ("\n" + SECTION_SEPARATOR).encode("utf-8")
+
+# Order of sections, defined explicitly to ensure consistency
+SECTIONS = (
+    # Core Principles
+    "core/00-prime-directives.md",
+    "core/01-operational-guardrails.md",
+    # Standards
+    "standards/02-coding-standards.md",
+    "guides/03-common-pitfalls.md",
+    # Reference
+    "guides/04-key-commands.md",
+    "guides/05-key-paths.md",
+    # Processes
+    "standards/06-ai-assisted-development.md",
+    "standards/07-documentation.md",
+    "standards/09-framework-guidelines.md",
+    "guides/08-reasoning-logs.md",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_rules_dir() -> Path:
+    """Directory holding the packaged rule files (this module's directory)."""
+    return Path(__file__).parent
+
 
 class RuleBuilder:
     """Builds the AGENT_KNOWLEDGE_BASE.md from modular rule files."""
@@ -34,7 +67,12 @@ class RuleBuilder:
             self.rules_dir = Path(rules_dir)
         else:
             # Default to the directory where this file resides
-            self.rules_dir = Path(__file__).parent
+            self.rules_dir = _default_rules_dir()
+
+        self._full_paths: List[Path] = [self.rules_dir / section for section in SECTIONS]
+
+        # Rule file contents keyed by path, tagged with the mtime they were read at
+        self._cache: Dict[Path, Tuple[int, bytes]] = {}
 
     def build(self) -> str:
         """Assemble all rule files into a single markdown string.
@@ -42,40 +80,45 @@ class RuleBuilder:
         Returns:
             The complete content of AGENT_KNOWLEDGE_BASE.md
         """
-        content = [HEADER]
-        
-        # Define the order of sections explicitly to ensure consistency
-        sections = [
-            # Core Principles
-            "core/00-prime-directives.md",
-            "core/01-operational-guardrails.md",
-            
-            # Standards
-            "standards/02-coding-standards.md",
-            "guides/03-common-pitfalls.md",
-            
-            # Reference
-            "guides/04-key-commands.md",
-            "guides/05-key-paths.md",
-            
-            # Processes
-            "standards/06-ai-assisted-development.md",
-            "standards/07-documentation.md",
-            "standards/09-framework-guidelines.md",
-            "guides/08-reasoning-logs.md",
-        ]
-
-        for section_path in sections:
-            full_path = self.rules_dir / section_path
-            if full_path.exists():
-                with open(full_path, "r", encoding="utf-8") as f:
-                    file_content = f.read().strip()
-                    content.append(file_content)
-                    content.append("\n\n---\n")
-            else:
+        return b"".join(self._iter_chunks()).decode("utf-8")
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        """Yield the UTF-8 encoded document piece by piece."""
+        # Read all sections concurrently; map() preserves section order
+        with ThreadPoolExecutor(max_workers=len(self._full_paths)) as executor:
+            results = list(executor.map(self._read_section, self._full_paths))
+
+        yield HEADER_BYTES
+        for section_path, text in zip(SECTIONS, results):
+            if text is None:
                 print(f"Warning: Rule file not found: {section_path}")
+                continue
+            yield b"\n"
+            yield text
+            yield _SECTION_SUFFIX
+
+    def _read_section(self, full_path: Path) -> Optional[bytes]:
+        """Read a rule file, reusing the cached content if it is unchanged.
+
+        Args:
+            full_path: Path to the rule file.
+
+        Returns:
+            The stripped file content, or None if the file does not exist.
+        """
+        try:
+            mtime_ns = full_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._cache.pop(full_path, None)
+            return None
+
+        cached = self._cache.get(full_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
 
-        return "\n".join(content)
+        text = full_path.read_bytes().strip()
+        self._cache[full_path] = (mtime_ns, text)
+        return text
 
     def write_to_file(self, output_path: str) -> None:
         """Write the built content to a file.
@@ -83,9 +126,9 @@ class RuleBuilder:
         Args:
             output_path: Destination path for the generated markdown file.
         """
-        content = self.build()
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        with open(output_path, "wb") as f:
+            for chunk in self._iter_chunks():
+                f.write(chunk)
         print(f"Successfully generated agent rules at: {output_path}")
 
 
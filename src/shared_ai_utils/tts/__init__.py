@@ -10,6 +10,8 @@ from .providers import (
     TTSResponse,
     ElevenLabsTTSProvider,
     OpenAITTSProvider,
+    CachingTTSMixin,
+    close_shared_client,
 )
 from .manager import TTSManager, get_tts_manager
 
@@ -18,6 +20,8 @@ __all__ = [
     "TTSResponse",
     "ElevenLabsTTSProvider",
     "OpenAITTSProvider",
+    "CachingTTSMixin",
     "TTSManager",
     "get_tts_manager",
+    "close_shared_client",
 ]
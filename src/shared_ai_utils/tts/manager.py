@@ -5,18 +5,74 @@ Provides a high-level interface for TTS with automatic provider fallback
 and caching support.
 """
 
+import asyncio
 import logging
-from typing import AsyncIterator, Optional
+import threading
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from .providers import (
     TTSProvider,
     TTSResponse,
     ElevenLabsTTSProvider,
     OpenAITTSProvider,
+    _AudioCache,
 )
 
 logger = logging.getLogger(__name__)
 
+# Default in-memory audio cache budget (bytes)
+DEFAULT_AUDIO_CACHE_BYTES = 64 << 20
+
+# Streamed audio is re-chunked to at least this many bytes, but no buffered audio
+# is held back for longer than this many seconds
+STREAM_FLUSH_BYTES = 4096
+STREAM_FLUSH_INTERVAL = 0.05
+
+
+async def _coalesce_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Merge small audio chunks so consumers see fewer, larger yields.
+
+    A buffer is flushed once it reaches STREAM_FLUSH_BYTES, or once its oldest
+    bytes have waited STREAM_FLUSH_INTERVAL seconds, even if no further chunk
+    has arrived, so slow streams still start playing promptly.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = chunks.__aiter__()
+    buffer = bytearray()
+    deadline = 0.0
+    # Read still in flight when the deadline flushed the buffer
+    pending: Optional["asyncio.Future[bytes]"] = None
+    try:
+        while True:
+            if buffer:
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                done, _ = await asyncio.wait((pending,), timeout=deadline - loop.time())
+                if not done:
+                    yield bytes(buffer)
+                    buffer.clear()
+                    continue
+            try:
+                if pending is not None:
+                    read, pending = pending, None
+                    chunk = await read
+                else:
+                    chunk = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+            if not buffer:
+                deadline = loop.time() + STREAM_FLUSH_INTERVAL
+            buffer += chunk
+            if len(buffer) >= STREAM_FLUSH_BYTES:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+
 
 class TTSManager:
     """
@@ -39,6 +95,8 @@ class TTSManager:
         fallback_provider: Optional[str] = "openai",
         elevenlabs_api_key: Optional[str] = None,
         openai_api_key: Optional[str] = None,
+        audio_cache_bytes: int = DEFAULT_AUDIO_CACHE_BYTES,
+        hedge_delay: Optional[float] = None,
     ):
         """
         Initialize TTS manager.
@@ -48,44 +106,95 @@ class TTSManager:
             fallback_provider: Fallback provider name (None to disable)
             elevenlabs_api_key: ElevenLabs API key (or use env var)
             openai_api_key: OpenAI API key (or use env var)
+            audio_cache_bytes: Budget for caching generated audio in memory (0 disables)
+            hedge_delay: Seconds to wait on the primary provider before also starting
+                the fallback and taking whichever finishes first (None disables)
         """
-        self.primary_provider: Optional[TTSProvider] = None
-        self.fallback_provider: Optional[TTSProvider] = None
+        self.hedge_delay = hedge_delay
+        self._audio_cache = _AudioCache(audio_cache_bytes) if audio_cache_bytes > 0 else None
 
-        # Initialize primary provider
-        if primary_provider in self.PROVIDER_MAP:
-            api_key = (
-                elevenlabs_api_key if primary_provider == "elevenlabs" else openai_api_key
-            )
-            try:
-                self.primary_provider = self.PROVIDER_MAP[primary_provider](api_key)
-                if not self.primary_provider.is_available():
-                    logger.warning(
-                        f"Primary TTS provider {primary_provider} not available (missing API key)"
-                    )
-                    self.primary_provider = None
-            except Exception as e:
-                logger.warning(f"Failed to initialize primary TTS provider: {e}")
+        self.primary_provider = self._make_provider(
+            primary_provider, elevenlabs_api_key, openai_api_key
+        )
+        if self.primary_provider is None and primary_provider in self.PROVIDER_MAP:
+            logger.warning(f"Primary TTS provider {primary_provider} not available")
 
-        # Initialize fallback provider
-        if fallback_provider and fallback_provider in self.PROVIDER_MAP:
-            api_key = (
-                elevenlabs_api_key if fallback_provider == "elevenlabs" else openai_api_key
+        self.fallback_provider = self._make_provider(
+            fallback_provider, elevenlabs_api_key, openai_api_key
+        )
+
+        # Providers grouped by name, in priority order, for list_voices(provider=...)
+        self._by_name: Dict[str, List[TTSProvider]] = {}
+        for provider in (self.primary_provider, self.fallback_provider):
+            if provider is not None:
+                self._by_name.setdefault(provider.provider_name, []).append(provider)
+
+        self._primary_ok = False
+        self._fallback_ok = False
+        self.refresh_availability()
+
+    def refresh_availability(self) -> None:
+        """Re-check provider availability (cached at init for the hot path)."""
+        self._primary_ok = bool(self.primary_provider and self.primary_provider.is_available())
+        self._fallback_ok = bool(
+            self.fallback_provider and self.fallback_provider.is_available()
+        )
+        # Usable providers in priority order
+        self._providers: Tuple[TTSProvider, ...] = tuple(
+            provider
+            for provider, ok in (
+                (self.primary_provider, self._primary_ok),
+                (self.fallback_provider, self._fallback_ok),
             )
-            try:
-                self.fallback_provider = self.PROVIDER_MAP[fallback_provider](api_key)
-                if not self.fallback_provider.is_available():
-                    logger.debug(f"Fallback TTS provider {fallback_provider} not available")
-                    self.fallback_provider = None
-            except Exception as e:
-                logger.warning(f"Failed to initialize fallback TTS provider: {e}")
+            if ok
+        )
+
+    def _make_provider(
+        self,
+        name: Optional[str],
+        elevenlabs_api_key: Optional[str],
+        openai_api_key: Optional[str],
+    ) -> Optional[TTSProvider]:
+        """
+        Create a provider by name.
+
+        Args:
+            name: Provider name ("elevenlabs" or "openai")
+            elevenlabs_api_key: ElevenLabs API key (or use env var)
+            openai_api_key: OpenAI API key (or use env var)
+
+        Returns:
+            Provider instance, or None if unknown, unavailable, or failing to initialize
+        """
+        provider_class = self.PROVIDER_MAP.get(name) if name else None
+        if provider_class is None:
+            return None
+
+        api_key = elevenlabs_api_key if name == "elevenlabs" else openai_api_key
+        try:
+            # Providers fall back to the module's pooled client, which is created
+            # lazily and recreated per event loop
+            provider = provider_class(api_key)
+        except Exception as e:
+            logger.warning(f"Failed to initialize TTS provider {name}: {e}")
+            return None
+
+        if not provider.is_available():
+            logger.debug(f"TTS provider {name} not available (missing API key)")
+            return None
+        return provider
+
+    async def aclose(self) -> None:
+        """Release manager resources.
+
+        Providers use the module's pooled HTTP client, which other managers and
+        providers share, so it is left open; close it with close_shared_client()
+        at application shutdown.
+        """
 
     def is_available(self) -> bool:
         """Check if any TTS provider is available."""
-        return (
-            (self.primary_provider is not None and self.primary_provider.is_available())
-            or (self.fallback_provider is not None and self.fallback_provider.is_available())
-        )
+        return self._primary_ok or self._fallback_ok
 
     async def generate_speech(
         self,
@@ -107,24 +216,74 @@ class TTSManager:
         Raises:
             Exception: If all providers fail
         """
-        # Try primary provider
-        if self.primary_provider and self.primary_provider.is_available():
-            try:
-                return await self.primary_provider.generate_speech(text, voice, model)
-            except Exception as e:
-                logger.warning(f"Primary TTS provider failed: {e}")
-
-        # Try fallback provider
-        if self.fallback_provider and self.fallback_provider.is_available():
+        cache_key = None
+        if self._audio_cache is not None:
+            cache_key = self._audio_cache.make_key(text, voice, model)
+            cached = self._audio_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        response = await self._generate_uncached(text, voice, model)
+        if cache_key is not None:
+            self._audio_cache.put(cache_key, response)
+        return response
+
+    async def _generate_uncached(
+        self,
+        text: str,
+        voice: Optional[str],
+        model: Optional[str],
+    ) -> TTSResponse:
+        """Generate speech from the providers, trying primary then fallback."""
+        if self.hedge_delay is not None and self._primary_ok and self._fallback_ok:
+            return await self._generate_hedged(text, voice, model)
+
+        last_error: Optional[Exception] = None
+        for provider in self._providers:
+            if last_error is not None:
+                logger.info(f"Falling back to TTS provider {provider.provider_name}")
             try:
-                logger.info("Falling back to secondary TTS provider")
-                return await self.fallback_provider.generate_speech(text, voice, model)
+                return await provider.generate_speech(text, voice, model)
             except Exception as e:
-                logger.error(f"Fallback TTS provider also failed: {e}")
-                raise
+                logger.warning(f"TTS provider {provider.provider_name} failed: {e}")
+                last_error = e
 
+        if last_error is not None:
+            raise last_error
         raise Exception("No TTS providers available")
 
+    async def _generate_hedged(
+        self,
+        text: str,
+        voice: Optional[str],
+        model: Optional[str],
+    ) -> TTSResponse:
+        """Race the primary against a delayed fallback, returning the first success."""
+        primary = asyncio.create_task(self.primary_provider.generate_speech(text, voice, model))
+
+        async def _hedge() -> TTSResponse:
+            # Start early if the primary fails before the delay elapses
+            await asyncio.wait({primary}, timeout=self.hedge_delay)
+            return await self.fallback_provider.generate_speech(text, voice, model)
+
+        pending = {primary, asyncio.create_task(_hedge())}
+        last_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    label = "Primary" if task is primary else "Fallback"
+                    logger.warning(f"{label} TTS provider failed: {error}")
+                    last_error = error
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def stream_speech(
         self,
         text: str,
@@ -145,26 +304,20 @@ class TTSManager:
         Raises:
             Exception: If all providers fail
         """
-        # Try primary provider
-        if self.primary_provider and self.primary_provider.is_available():
-            try:
-                async for chunk in self.primary_provider.stream_speech(text, voice, model):
-                    yield chunk
-                return
-            except Exception as e:
-                logger.warning(f"Primary TTS provider streaming failed: {e}")
-
-        # Try fallback provider
-        if self.fallback_provider and self.fallback_provider.is_available():
+        last_error: Optional[Exception] = None
+        for provider in self._providers:
+            if last_error is not None:
+                logger.info(f"Falling back to TTS provider {provider.provider_name} for streaming")
             try:
-                logger.info("Falling back to secondary TTS provider for streaming")
-                async for chunk in self.fallback_provider.stream_speech(text, voice, model):
+                async for chunk in _coalesce_chunks(provider.stream_speech(text, voice, model)):
                     yield chunk
                 return
             except Exception as e:
-                logger.error(f"Fallback TTS provider streaming also failed: {e}")
-                raise
+                logger.warning(f"TTS provider {provider.provider_name} streaming failed: {e}")
+                last_error = e
 
+        if last_error is not None:
+            raise last_error
         raise Exception("No TTS providers available")
 
     async def list_voices(self, provider: Optional[str] = None) -> list[dict]:
@@ -178,27 +331,14 @@ class TTSManager:
             List of voice dictionaries
         """
         if provider:
-            if provider == "elevenlabs" and isinstance(
-                self.primary_provider, ElevenLabsTTSProvider
-            ):
-                return await self.primary_provider.list_voices()
-            elif provider == "elevenlabs" and isinstance(
-                self.fallback_provider, ElevenLabsTTSProvider
-            ):
-                return await self.fallback_provider.list_voices()
-            elif provider == "openai" and isinstance(
-                self.primary_provider, OpenAITTSProvider
-            ):
-                return await self.primary_provider.list_voices()
-            elif provider == "openai" and isinstance(
-                self.fallback_provider, OpenAITTSProvider
-            ):
-                return await self.fallback_provider.list_voices()
+            named = self._by_name.get(provider)
+            if named:
+                return await named[0].list_voices()
 
         # Return from first available provider
-        if self.primary_provider and self.primary_provider.is_available():
+        if self._primary_ok:
             return await self.primary_provider.list_voices()
-        if self.fallback_provider and self.fallback_provider.is_available():
+        if self._fallback_ok:
             return await self.fallback_provider.list_voices()
 
         return []
@@ -206,6 +346,7 @@ class TTSManager:
 
 # Singleton instance for convenience
 _tts_manager: Optional[TTSManager] = None
+_tts_manager_lock = threading.Lock()
 
 
 def get_tts_manager(**kwargs) -> TTSManager:
@@ -220,5 +361,7 @@ def get_tts_manager(**kwargs) -> TTSManager:
     """
     global _tts_manager
     if _tts_manager is None:
-        _tts_manager = TTSManager(**kwargs)
+        with _tts_manager_lock:
+            if _tts_manager is None:
+                _tts_manager = TTSManager(**kwargs)
     return _tts_manager
@@ -8,16 +8,205 @@ Extracted from council-ai for cross-project reuse.
 """
 
 import asyncio
+import dataclasses
+import hashlib
+import importlib.util
+import json
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Optional
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Optional, Union
 
 import httpx
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 lets concurrent requests share one connection; needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Read size for streamed audio; larger chunks amortize per-chunk async overhead
+TTS_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of error-body bytes included in log messages
+ERROR_BODY_LOG_BYTES = 512
+
+# How long a fetched voice catalog is reused before refetching (seconds)
+VOICES_CACHE_TTL = 300.0
+
+# Static voice catalogs, built once and shared read-only
+_ELEVEN_DEFAULT_VOICES = tuple(
+    MappingProxyType(voice)
+    for voice in (
+        {"id": "EXAVITQu4vr4xnSDxMaL", "name": "Sarah", "category": "premade"},
+        {"id": "21m00Tcm4TlvDq8ikWAM", "name": "Rachel", "category": "premade"},
+        {"id": "AZnzlk1XvdvUeBnXmlld", "name": "Domi", "category": "premade"},
+        {"id": "pNInz6obpgDQGcFmaJgB", "name": "Adam", "category": "premade"},
+    )
+)
+
+# OpenAI voices are hardcoded in their API
+_OPENAI_VOICES = tuple(
+    MappingProxyType(voice)
+    for voice in (
+        {"id": "alloy", "name": "Alloy", "description": "Neutral and balanced"},
+        {"id": "echo", "name": "Echo", "description": "Male voice"},
+        {"id": "fable", "name": "Fable", "description": "British accent"},
+        {"id": "onyx", "name": "Onyx", "description": "Deep and authoritative"},
+        {"id": "nova", "name": "Nova", "description": "Friendly female"},
+        {"id": "shimmer", "name": "Shimmer", "description": "Warm and expressive"},
+    )
+)
+
+# Chunks read ahead of the consumer when streaming
+STREAM_QUEUE_SIZE = 8
+
+# Default in-memory budget for CachingTTSMixin (bytes)
+DEFAULT_PROVIDER_CACHE_BYTES = 10 << 20
+
+
+# Process-wide HTTP client shared by providers that were not given one
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use.
+
+    The client is tied to the event loop it was created on, so a new one is
+    created if called from a different loop (e.g. successive asyncio.run calls).
+    The stale client is closed first so its connections are not leaked.
+    """
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        if _shared_client is not None and not _shared_client.is_closed:
+            try:
+                await _shared_client.aclose()
+            except Exception as e:
+                # Its loop may already be closed; the sockets go with it
+                logger.debug(f"Failed to close stale TTS HTTP client: {e}")
+        _shared_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=20, keepalive_expiry=300
+            ),
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client.
+
+    Every provider without an injected client uses this one pool, so call this
+    only from an application-level shutdown hook, on the loop that used it.
+    """
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_client_loop = None
+
+
+async def _read_body(response: httpx.Response) -> bytes:
+    """Read a streamed response body into a single buffer.
+
+    Avoids keeping httpx's internal copy of the body alongside the returned bytes.
+    """
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes(chunk_size=TTS_STREAM_CHUNK_SIZE):
+        buffer += chunk
+    return bytes(buffer)
+
+
+async def _log_error_response(response: httpx.Response, label: str) -> None:
+    """Log the start of an error response body without reading all of it."""
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    snippet = bytearray()
+    async for chunk in response.aiter_bytes():
+        snippet += chunk
+        if len(snippet) >= ERROR_BODY_LOG_BYTES:
+            break
+    logger.error(
+        "%s %s: %s",
+        label,
+        response.status_code,
+        snippet[:ERROR_BODY_LOG_BYTES].decode("utf-8", errors="replace"),
+    )
+
+
+async def _prefetch_chunks(
+    chunks: AsyncIterator[bytes], maxsize: int = STREAM_QUEUE_SIZE
+) -> AsyncIterator[bytes]:
+    """Read chunks in a background task and yield whatever has arrived, joined.
+
+    The bounded queue applies backpressure to the reader, while chunks that
+    arrive back-to-back are handed to the consumer in a single yield.
+    """
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=maxsize)
+    done = object()
+    stopping = False
+
+    async def produce() -> None:
+        try:
+            async for chunk in chunks:
+                if chunk:
+                    await queue.put(chunk)
+        except BaseException as e:
+            if stopping:
+                raise
+            # Forward everything, including cancellation raised by the reader itself
+            await queue.put(e)
+        else:
+            await queue.put(done)
+        finally:
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    producer = asyncio.create_task(produce())
+    try:
+        finished = False
+        while not finished:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            error = None
+            if batch[-1] is done:
+                finished = True
+                batch.pop()
+            elif isinstance(batch[-1], BaseException):
+                error = batch.pop()
+            if batch:
+                # Deliver chunks read before a failure, then raise it
+                yield b"".join(batch)
+            if error is not None:
+                raise error
+    finally:
+        stopping = True
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
 
 @dataclass
 class TTSResponse:
@@ -39,6 +228,8 @@ class TTSResponse:
 class TTSProvider(ABC):
     """Abstract base class for TTS providers (async-first)."""
 
+    _CONTENT_TYPE_JSON = "application/json"
+
     @abstractmethod
     async def generate_speech(
         self, text: str, voice: Optional[str] = None, model: Optional[str] = None
@@ -94,6 +285,87 @@ class TTSProvider(ABC):
         """Return provider name (e.g., 'elevenlabs', 'openai')."""
         pass
 
+    async def generate_speech_cancellable(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        model: Optional[str] = None,
+        *,
+        cancel_event: asyncio.Event,
+    ) -> Optional[TTSResponse]:
+        """
+        Generate speech, abandoning the request as soon as cancel_event is set.
+
+        Cancelling the in-flight request closes its HTTP stream, so the connection
+        goes back to the pool instead of being held until the request times out.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice ID or name
+            model: TTS model to use
+            cancel_event: Event signalling that the result is no longer wanted
+
+        Returns:
+            TTSResponse, or None if cancelled before generation finished
+        """
+        if cancel_event.is_set():
+            return None
+
+        task = asyncio.create_task(self.generate_speech(text, voice, model))
+        waiter = asyncio.create_task(cancel_event.wait())
+        try:
+            await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+        if task.cancelled():
+            return None
+        return task.result()
+
+
+class _AudioCache:
+    """LRU cache of generated speech, bounded by total audio bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, TTSResponse]" = OrderedDict()
+        self._size = 0
+
+    @staticmethod
+    def make_key(
+        text: str, voice: Optional[str], model: Optional[str], provider: str = ""
+    ) -> str:
+        """Build a cache key for a synthesis request."""
+        return hashlib.blake2b(
+            f"{provider}|{voice}|{model}|{text}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[TTSResponse]:
+        """Return a copy of the cached response, or None on a miss."""
+        response = self._entries.get(key)
+        if response is None:
+            return None
+        self._entries.move_to_end(key)
+        return dataclasses.replace(response, metadata=dict(response.metadata))
+
+    def put(self, key: str, response: TTSResponse) -> None:
+        """Cache a response, evicting least recently used entries over budget."""
+        size = len(response.audio_data)
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous.audio_data)
+        # Store a copy so the caller's later metadata edits do not reach the cache
+        self._entries[key] = dataclasses.replace(response, metadata=dict(response.metadata))
+        self._size += size
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.audio_data)
+
 
 class ElevenLabsTTSProvider(TTSProvider):
     """ElevenLabs TTS provider implementation."""
@@ -101,19 +373,32 @@ class ElevenLabsTTSProvider(TTSProvider):
     DEFAULT_VOICE = "EXAVITQu4vr4xnSDxMaL"  # Sarah voice
     DEFAULT_MODEL = "eleven_turbo_v2_5"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Shared by every request payload; never mutated
+    _VOICE_SETTINGS = {"stability": 0.5, "similarity_boost": 0.75}
+
+    def __init__(
+        self, api_key: Optional[str] = None, http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize ElevenLabs provider.
 
         Args:
             api_key: ElevenLabs API key (defaults to ELEVENLABS_API_KEY env var)
+            http_client: Shared HTTP client for connection reuse (optional)
         """
         self.api_key = api_key or os.getenv("ELEVENLABS_API_KEY")
         self.base_url = "https://api.elevenlabs.io/v1"
+        self._tts_base = f"{self.base_url}/text-to-speech/"
+        self._voices_url = httpx.URL(f"{self.base_url}/voices")
+        self._http_client = http_client
+        # The key is fixed at construction, so availability is checked once
+        self._available = bool(self.api_key)
+        self._voices_cache: Optional[tuple[MappingProxyType, ...]] = None
+        self._voices_cache_expiry = 0.0
 
     def is_available(self) -> bool:
         """Check if ElevenLabs API key is configured."""
-        return bool(self.api_key)
+        return self._available
 
     @property
     def provider_name(self) -> str:
@@ -131,28 +416,32 @@ class ElevenLabsTTSProvider(TTSProvider):
         voice = voice or self.DEFAULT_VOICE
         model = model or self.DEFAULT_MODEL
 
-        url = f"{self.base_url}/text-to-speech/{voice}"
-        headers = {"xi-api-key": self.api_key, "Content-Type": "application/json"}
+        url = httpx.URL(self._tts_base + voice)
+        headers = {"xi-api-key": self.api_key, "Content-Type": self._CONTENT_TYPE_JSON}
         payload = {
             "text": text,
             "model_id": model,
-            "voice_settings": {"stability": 0.5, "similarity_boost": 0.75},
+            "voice_settings": self._VOICE_SETTINGS,
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, headers=headers, timeout=30.0)
+            client = self._http_client or await _get_client()
+            async with client.stream(
+                "POST", url, content=_dumps(payload), headers=headers, timeout=30.0
+            ) as response:
                 if response.status_code != 200:
-                    logger.error(f"ElevenLabs TTS error: {response.text}")
+                    await _log_error_response(response, "ElevenLabs TTS error")
                     raise Exception(f"ElevenLabs API error: {response.status_code}")
 
-                return TTSResponse(
-                    audio_data=response.content,
-                    format="mp3",
-                    provider=self.provider_name,
-                    voice=voice,
-                    model=model,
-                )
+                audio_data = await _read_body(response)
+
+            return TTSResponse(
+                audio_data=audio_data,
+                format="mp3",
+                provider=self.provider_name,
+                voice=voice,
+                model=model,
+            )
         except Exception as e:
             logger.error(f"ElevenLabs TTS generation failed: {e}")
             raise
@@ -169,27 +458,27 @@ class ElevenLabsTTSProvider(TTSProvider):
         voice = voice or self.DEFAULT_VOICE
         model = model or self.DEFAULT_MODEL
 
-        url = f"{self.base_url}/text-to-speech/{voice}/stream"
-        headers = {"xi-api-key": self.api_key, "Content-Type": "application/json"}
+        url = httpx.URL(f"{self._tts_base}{voice}/stream")
+        headers = {"xi-api-key": self.api_key, "Content-Type": self._CONTENT_TYPE_JSON}
         payload = {
             "text": text,
             "model_id": model,
-            "voice_settings": {"stability": 0.5, "similarity_boost": 0.75},
+            "voice_settings": self._VOICE_SETTINGS,
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                async with client.stream(
-                    "POST", url, json=payload, headers=headers, timeout=30.0
-                ) as response:
-                    if response.status_code != 200:
-                        error_text = await response.aread()
-                        logger.error(f"ElevenLabs TTS streaming error: {error_text}")
-                        raise Exception(f"ElevenLabs API error: {response.status_code}")
-
-                    async for chunk in response.aiter_bytes(chunk_size=4096):
-                        if chunk:
-                            yield chunk
+            client = self._http_client or await _get_client()
+            async with client.stream(
+                "POST", url, content=_dumps(payload), headers=headers, timeout=30.0
+            ) as response:
+                if response.status_code != 200:
+                    await _log_error_response(response, "ElevenLabs TTS streaming error")
+                    raise Exception(f"ElevenLabs API error: {response.status_code}")
+
+                async for chunk in _prefetch_chunks(
+                    response.aiter_bytes(chunk_size=TTS_STREAM_CHUNK_SIZE)
+                ):
+                    yield chunk
         except Exception as e:
             logger.error(f"ElevenLabs TTS streaming failed: {e}")
             raise
@@ -199,40 +488,39 @@ class ElevenLabsTTSProvider(TTSProvider):
         if not self.is_available():
             return self._get_default_voices()
 
-        url = f"{self.base_url}/voices"
+        if self._voices_cache is not None and time.monotonic() < self._voices_cache_expiry:
+            return [dict(voice) for voice in self._voices_cache]
+
+        url = self._voices_url
         headers = {"xi-api-key": self.api_key}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, timeout=10.0)
-                if response.status_code != 200:
-                    logger.error(f"Failed to list ElevenLabs voices: {response.status_code}")
-                    return self._get_default_voices()
-
-                data = response.json()
-                voices = []
-                for voice in data.get("voices", []):
-                    voices.append(
-                        {
-                            "id": voice["voice_id"],
-                            "name": voice["name"],
-                            "category": voice.get("category", "premade"),
-                            "labels": voice.get("labels", {}),
-                        }
-                    )
-                return voices
+            client = self._http_client or await _get_client()
+            response = await client.get(url, headers=headers, timeout=10.0)
+            if response.status_code != 200:
+                logger.error(f"Failed to list ElevenLabs voices: {response.status_code}")
+                return self._get_default_voices()
+
+            data = _loads(response.content)
+            voices = [
+                {
+                    "id": voice["voice_id"],
+                    "name": voice["name"],
+                    "category": voice.get("category", "premade"),
+                    "labels": voice.get("labels", {}),
+                }
+                for voice in data.get("voices", ())
+            ]
+            self._voices_cache = tuple(MappingProxyType(dict(voice)) for voice in voices)
+            self._voices_cache_expiry = time.monotonic() + VOICES_CACHE_TTL
+            return voices
         except Exception as e:
             logger.error(f"Failed to fetch ElevenLabs voices: {e}")
             return self._get_default_voices()
 
     def _get_default_voices(self) -> list[dict]:
         """Return default voice options."""
-        return [
-            {"id": "EXAVITQu4vr4xnSDxMaL", "name": "Sarah", "category": "premade"},
-            {"id": "21m00Tcm4TlvDq8ikWAM", "name": "Rachel", "category": "premade"},
-            {"id": "AZnzlk1XvdvUeBnXmlld", "name": "Domi", "category": "premade"},
-            {"id": "pNInz6obpgDQGcFmaJgB", "name": "Adam", "category": "premade"},
-        ]
+        return [dict(voice) for voice in _ELEVEN_DEFAULT_VOICES]
 
 
 class OpenAITTSProvider(TTSProvider):
@@ -241,19 +529,27 @@ class OpenAITTSProvider(TTSProvider):
     DEFAULT_VOICE = "alloy"
     DEFAULT_MODEL = "tts-1"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self, api_key: Optional[str] = None, http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize OpenAI TTS provider.
 
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            http_client: Shared HTTP client for connection reuse (optional)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.base_url = "https://api.openai.com/v1"
+        self._speech_url = httpx.URL(f"{self.base_url}/audio/speech")
+        self._http_client = http_client
+        # The key is fixed at construction, so availability is checked once
+        self._available = bool(self.api_key)
+        self._auth_header = f"Bearer {self.api_key}"
 
     def is_available(self) -> bool:
         """Check if OpenAI API key is configured."""
-        return bool(self.api_key)
+        return self._available
 
     @property
     def provider_name(self) -> str:
@@ -271,52 +567,171 @@ class OpenAITTSProvider(TTSProvider):
         voice = voice or self.DEFAULT_VOICE
         model = model or self.DEFAULT_MODEL
 
-        url = f"{self.base_url}/audio/speech"
-        headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        url = self._speech_url
+        headers = {"Authorization": self._auth_header, "Content-Type": self._CONTENT_TYPE_JSON}
         payload = {"model": model, "input": text, "voice": voice, "response_format": "mp3"}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, headers=headers, timeout=30.0)
+            client = self._http_client or await _get_client()
+            async with client.stream(
+                "POST", url, content=_dumps(payload), headers=headers, timeout=30.0
+            ) as response:
                 if response.status_code != 200:
-                    logger.error(f"OpenAI TTS error: {response.text}")
+                    await _log_error_response(response, "OpenAI TTS error")
                     raise Exception(f"OpenAI API error: {response.status_code}")
 
-                return TTSResponse(
-                    audio_data=response.content,
-                    format="mp3",
-                    provider=self.provider_name,
-                    voice=voice,
-                    model=model,
-                )
+                audio_data = await _read_body(response)
+
+            return TTSResponse(
+                audio_data=audio_data,
+                format="mp3",
+                provider=self.provider_name,
+                voice=voice,
+                model=model,
+            )
         except Exception as e:
             logger.error(f"OpenAI TTS generation failed: {e}")
             raise
 
     async def stream_speech(
-        self, text: str, voice: Optional[str] = None, model: Optional[str] = None
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        model: Optional[str] = None,
+        chunk_size: int = TTS_STREAM_CHUNK_SIZE,
     ) -> AsyncIterator[bytes]:
         """
         Stream speech using OpenAI TTS API.
         Note: OpenAI doesn't support true streaming, so we generate and chunk the response.
+        The audio is fully buffered either way, so pass chunk_size <= 0 to receive it
+        in a single chunk.
         """
         tts_response = await self.generate_speech(text, voice, model)
 
+        if chunk_size <= 0:
+            yield tts_response.audio_data
+            return
+
         # Chunk the audio data for pseudo-streaming
-        chunk_size = 4096
-        audio_data = tts_response.audio_data
-        for i in range(0, len(audio_data), chunk_size):
-            yield audio_data[i : i + chunk_size]
-            await asyncio.sleep(0.01)  # Small delay to simulate streaming
+        audio_view = memoryview(tts_response.audio_data)
+        for i in range(0, len(audio_view), chunk_size):
+            yield bytes(audio_view[i : i + chunk_size])
 
     async def list_voices(self) -> list[dict]:
         """List available OpenAI voices."""
-        # OpenAI voices are hardcoded in their API
-        return [
-            {"id": "alloy", "name": "Alloy", "description": "Neutral and balanced"},
-            {"id": "echo", "name": "Echo", "description": "Male voice"},
-            {"id": "fable", "name": "Fable", "description": "British accent"},
-            {"id": "onyx", "name": "Onyx", "description": "Deep and authoritative"},
-            {"id": "nova", "name": "Nova", "description": "Friendly female"},
-            {"id": "shimmer", "name": "Shimmer", "description": "Warm and expressive"},
-        ]
+        return [dict(voice) for voice in _OPENAI_VOICES]
+
+
+class CachingTTSMixin:
+    """
+    Serve repeated synthesis requests from an LRU audio cache.
+
+    Mix in ahead of a concrete provider so identical (text, voice, model)
+    requests skip the API call. Audio can optionally be persisted to a
+    directory so the cache survives restarts.
+
+    Example:
+        class CachedOpenAITTSProvider(CachingTTSMixin, OpenAITTSProvider):
+            pass
+
+        provider = CachedOpenAITTSProvider(
+            cache_dir=get_workspace_data_dir("council-ai", "tts-cache")
+        )
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        audio_cache_bytes: int = DEFAULT_PROVIDER_CACHE_BYTES,
+        cache_dir: Optional[Union[str, Path]] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the cache, passing remaining arguments to the provider.
+
+        Args:
+            audio_cache_bytes: Budget for caching generated audio in memory
+            cache_dir: Directory to persist cached audio in (optional)
+        """
+        super().__init__(*args, **kwargs)
+        self._audio_cache = _AudioCache(audio_cache_bytes)
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _cache_key(self, text: str, voice: Optional[str], model: Optional[str]) -> str:
+        """Build the cache key using the provider's resolved defaults."""
+        return _AudioCache.make_key(
+            text,
+            voice or getattr(self, "DEFAULT_VOICE", None),
+            model or getattr(self, "DEFAULT_MODEL", None),
+            self.provider_name,
+        )
+
+    async def _cache_get(self, key: str) -> Optional[TTSResponse]:
+        """Look up a response in memory, then on disk."""
+        cached = self._audio_cache.get(key)
+        if cached is not None or self._cache_dir is None:
+            return cached
+
+        path = self._cache_dir / f"{key}.mp3"
+        try:
+            audio_data = await asyncio.to_thread(path.read_bytes)
+        except OSError:
+            return None
+        response = TTSResponse(audio_data=audio_data, format="mp3", provider=self.provider_name)
+        self._audio_cache.put(key, response)
+        return self._audio_cache.get(key) or response
+
+    async def _cache_put(self, key: str, response: TTSResponse) -> None:
+        """Store a response in memory and, if configured, on disk."""
+        self._audio_cache.put(key, response)
+        if self._cache_dir is None or response.format != "mp3":
+            return
+        try:
+            await asyncio.to_thread(
+                (self._cache_dir / f"{key}.mp3").write_bytes, response.audio_data
+            )
+        except OSError as e:
+            logger.warning(f"Failed to persist TTS cache entry: {e}")
+
+    async def generate_speech(
+        self, text: str, voice: Optional[str] = None, model: Optional[str] = None
+    ) -> TTSResponse:
+        """Generate speech, returning cached audio when available."""
+        key = self._cache_key(text, voice, model)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        response = await super().generate_speech(text, voice, model)
+        await self._cache_put(key, response)
+        return response
+
+    async def stream_speech(
+        self, text: str, voice: Optional[str] = None, model: Optional[str] = None, **kwargs: Any
+    ) -> AsyncIterator[bytes]:
+        """Stream speech, replaying cached audio when available.
+
+        Extra keyword arguments (e.g. chunk_size) are passed to the provider; a
+        chunk_size is also honoured when replaying, with <= 0 meaning one chunk.
+        """
+        key = self._cache_key(text, voice, model)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            chunk_size = kwargs.get("chunk_size", TTS_STREAM_CHUNK_SIZE)
+            if chunk_size <= 0:
+                yield cached.audio_data
+                return
+            audio_view = memoryview(cached.audio_data)
+            for i in range(0, len(audio_view), chunk_size):
+                yield bytes(audio_view[i : i + chunk_size])
+            return
+
+        buffer = bytearray()
+        async for chunk in super().stream_speech(text, voice, model, **kwargs):
+            buffer += chunk
+            yield chunk
+        await self._cache_put(
+            key, TTSResponse(audio_data=bytes(buffer), format="mp3", provider=self.provider_name)
+        )
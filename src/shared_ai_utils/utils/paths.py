@@ -7,7 +7,7 @@ and data directories, avoiding writes to user home directories.
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 
 def find_workspace_root(start_path: Optional[Path] = None) -> Optional[Path]:
@@ -26,22 +26,58 @@ def find_workspace_root(start_path: Optional[Path] = None) -> Optional[Path]:
     if start_path is None:
         start_path = Path.cwd()
 
-    current = Path(start_path).resolve()
+    root = _find_root_cached(os.path.realpath(start_path))
+    return Path(root) if root is not None else None
 
-    while current != current.parent:
-        # Check for workspace config directory
-        if (current / ".workspace-config").exists():
-            return current
 
-        # Check for workspace root marker (Gits directory with .git)
-        if current.name == "Gits" and (current / ".git").exists():
-            return current
+# Positive root lookups keyed by resolved start directory. Misses are never cached,
+# so a workspace marker created later (e.g. by get_workspace_config_dir) is found.
+_ROOT_CACHE: Dict[str, str] = {}
+_ROOT_CACHE_SIZE = 128
+
+
+def _is_workspace_root(path: str) -> bool:
+    """Check whether a directory carries a workspace root marker."""
+    if os.path.exists(os.path.join(path, ".workspace-config")):
+        return True
+    return os.path.basename(path) == "Gits" and os.path.exists(os.path.join(path, ".git"))
 
-        current = current.parent
+
+def _find_root_cached(resolved: str) -> Optional[str]:
+    """Walk up from an already-resolved directory, reusing still-valid cached roots.
+
+    A hit only re-checks the cached root's own marker. Re-walking below it would
+    cost as much as an uncached lookup, so a marker created later between the
+    start directory and the cached root is not seen until clear_workspace_cache().
+    """
+    cached = _ROOT_CACHE.get(resolved)
+    if cached is not None:
+        # One check instead of a full walk; drop the entry if the marker was removed
+        if _is_workspace_root(cached):
+            return cached
+        del _ROOT_CACHE[resolved]
+
+    current = resolved
+    parent = os.path.dirname(current)
+    while current != parent:
+        if _is_workspace_root(current):
+            if len(_ROOT_CACHE) >= _ROOT_CACHE_SIZE:
+                _ROOT_CACHE.clear()
+            _ROOT_CACHE[resolved] = current
+            return current
+        current, parent = parent, os.path.dirname(parent)
 
     return None
 
 
+def clear_workspace_cache() -> None:
+    """Forget cached workspace lookups.
+
+    Call this after creating a workspace marker below an already-found root.
+    """
+    _ROOT_CACHE.clear()
+
+
 def get_workspace_config_dir(app_name: Optional[str] = None) -> Path:
     """Get workspace-relative config directory.
 
@@ -108,9 +144,7 @@ def get_config_path(
 
     # Fallback to home directory if requested
     if fallback_home:
-        from pathlib import Path as PathLib
-
-        return PathLib.home() / ".config" / app_name / filename
+        return Path.home() / ".config" / app_name / filename
 
     # Default: workspace-relative even if workspace not found
     return get_workspace_config_dir(app_name) / filename
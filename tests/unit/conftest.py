@@ -0,0 +1,24 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from shared_ai_utils.rules.builder import RuleBuilder
+from shared_ai_utils.tts import TTSManager
+
+
+@pytest.fixture(scope="session")
+def default_rule_builder():
+    """RuleBuilder over the packaged rules directory, shared across the session."""
+    return RuleBuilder()
+
+
+@pytest.fixture(scope="session")
+def default_built_content(default_rule_builder):
+    """Knowledge base assembled once from the packaged rules."""
+    return default_rule_builder.build()
+
+
+@pytest.fixture(scope="session")
+def default_tts_manager():
+    """TTSManager built from the environment, shared by read-only tests."""
+    return TTSManager()
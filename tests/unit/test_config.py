@@ -1,14 +1,20 @@
 """Tests for configuration system."""
 
 import os
-import tempfile
-from pathlib import Path
+from enum import Enum
 from unittest.mock import patch
 
 import pytest
 from pydantic import Field
 
-from shared_ai_utils.config import ConfigBase, ConfigManager, PresetManager, get_preset, list_presets
+from shared_ai_utils.config import (
+    ConfigBase,
+    ConfigManager,
+    PresetManager,
+    get_preset,
+    get_preset_view,
+    list_presets,
+)
 
 
 class TestConfigClass(ConfigBase):
@@ -43,12 +49,26 @@ class TestConfigBase:
         assert config.get("api_key", "default") == ""
         assert config.get("nonexistent", "default") == "default"
 
+    def test_get_nested_dict_path(self):
+        """Test dot-notation access through nested dict values."""
+        config = TestConfigClass()
+        object.__setattr__(config, "extras", {"api": {"provider": "openai"}})
+        assert config.get("extras.api.provider") == "openai"
+        assert config.get("extras.api.missing", "default") == "default"
+
     def test_set_dot_notation(self):
         """Test dot-notation setting."""
         config = TestConfigClass()
         config.set("api_key", "new-key")
         assert config.api_key == "new-key"
 
+    def test_validator_built_once(self):
+        """Test subclasses reuse the validator compiled at class creation."""
+        validator = TestConfigClass.__pydantic_validator__
+        TestConfigClass()
+        TestConfigClass(API_KEY="other")
+        assert TestConfigClass.__pydantic_validator__ is validator
+
 
 class TestPresetManager:
     """Test PresetManager."""
@@ -61,6 +81,17 @@ class TestPresetManager:
         assert preset["APP_ENV"] == "development"
         assert preset["DEBUG"] is True
 
+    def test_builtin_presets_shared_and_protected(self):
+        """Test built-in presets are shared read-only and copied on access."""
+        first, second = PresetManager(), PresetManager()
+        assert first.presets is second.presets
+
+        preset = first.get_preset("development")
+        preset["DEBUG"] = False
+        assert second.get_preset("development")["DEBUG"] is True
+        with pytest.raises(TypeError):
+            first.presets["development"]["DEBUG"] = False
+
     def test_get_preset_invalid(self):
         """Test getting invalid preset."""
         manager = PresetManager()
@@ -91,62 +122,96 @@ class TestPresetManager:
         manager.delete_preset("temp")
         with pytest.raises(ValueError):
             manager.get_preset("temp")
+        assert "temp" not in manager.list_presets()
+
+    def test_save_preset_with_str_enum_name(self):
+        """Test str subclasses are accepted as preset names and keys."""
+
+        class Name(str, Enum):
+            CUSTOM = "enum_custom"
+
+        manager = PresetManager()
+        manager.save_preset(Name.CUSTOM, {Name.CUSTOM: "value"})
+        try:
+            assert manager.get_preset("enum_custom") == {"enum_custom": "value"}
+        finally:
+            manager.delete_preset(Name.CUSTOM)
+
+    def test_list_presets_returns_dict(self):
+        """Test list_presets returns an independent plain dict."""
+        manager = PresetManager()
+        presets = manager.list_presets()
+        assert type(presets) is dict
+        presets["new"] = "value"
+        assert "new" not in manager.list_presets()
+
+    def test_list_presets_view_cached(self):
+        """Test list_presets_view reuses its result until presets change."""
+        manager = PresetManager()
+        first = manager.list_presets_view()
+        assert manager.list_presets_view() is first
+        with pytest.raises(TypeError):
+            first["new"] = "value"
+
+        manager.save_preset("cached_custom", {"KEY": "value"})
+        try:
+            refreshed = manager.list_presets_view()
+            assert refreshed is not first
+            assert "cached_custom" in refreshed
+        finally:
+            manager.delete_preset("cached_custom")
 
 
 class TestConfigManager:
     """Test ConfigManager."""
 
-    def test_load_config_from_file(self):
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        """Per-test config file under pytest's shared temp root."""
+        return tmp_path / "config.yaml"
+
+    def test_load_config_from_file(self, config_file):
         """Test loading config from YAML file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.yaml"
-            # YAML format for Pydantic model
-            config_file.write_text("API_KEY: test-key\nDEBUG: true\n")
+        # YAML format for Pydantic model
+        config_file.write_text("API_KEY: test-key\nDEBUG: true\n")
 
-            manager = ConfigManager(config_path=str(config_file))
-            config = manager.load(TestConfigClass)
+        manager = ConfigManager(config_path=str(config_file))
+        config = manager.load(TestConfigClass)
 
-            # Config loads from YAML, but field names use aliases
-            assert config.api_key == "test-key" or config.get("api_key") == "test-key"
-            assert config.debug is True
+        # Config loads from YAML, but field names use aliases
+        assert config.api_key == "test-key" or config.get("api_key") == "test-key"
+        assert config.debug is True
 
-    def test_save_config_to_file(self):
+    def test_save_config_to_file(self, config_file):
         """Test saving config to YAML file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.yaml"
-            manager = ConfigManager(config_path=str(config_file))
+        manager = ConfigManager(config_path=str(config_file))
 
-            # Set values using environment or direct assignment
-            import os
-            with patch.dict(os.environ, {"API_KEY": "saved-key", "DEBUG": "true"}):
-                config = TestConfigClass()
-                manager.save(config)
+        # Set values using environment or direct assignment
+        with patch.dict(os.environ, {"API_KEY": "saved-key", "DEBUG": "true"}):
+            config = TestConfigClass()
+            manager.save(config)
 
-            assert config_file.exists()
-            content = config_file.read_text()
-            # YAML may use field names or aliases
-            assert "saved-key" in content or "api_key" in content.lower()
+        assert config_file.exists()
+        content = config_file.read_text()
+        # YAML may use field names or aliases
+        assert "saved-key" in content or "api_key" in content.lower()
 
-    def test_get_dot_notation(self):
+    def test_get_dot_notation(self, config_file):
         """Test getting values with dot notation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.yaml"
-            manager = ConfigManager(config_path=str(config_file))
-            config = manager.load(TestConfigClass)
-            config.api_key = "test"
+        manager = ConfigManager(config_path=str(config_file))
+        config = manager.load(TestConfigClass)
+        config.api_key = "test"
 
-            value = manager.get("api_key")
-            assert value == "test"
+        value = manager.get("api_key")
+        assert value == "test"
 
-    def test_set_dot_notation(self):
+    def test_set_dot_notation(self, config_file):
         """Test setting values with dot notation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_file = Path(tmpdir) / "config.yaml"
-            manager = ConfigManager(config_path=str(config_file))
-            config = manager.load(TestConfigClass)
+        manager = ConfigManager(config_path=str(config_file))
+        config = manager.load(TestConfigClass)
 
-            manager.set("api_key", "new-value")
-            assert config.api_key == "new-value"
+        manager.set("api_key", "new-value")
+        assert config.api_key == "new-value"
 
 
 class TestPresetFunctions:
@@ -158,6 +223,16 @@ class TestPresetFunctions:
         assert isinstance(preset, dict)
         assert "APP_ENV" in preset
 
+    def test_get_preset_view_function(self):
+        """Test get_preset_view returns a cached read-only mapping."""
+        view = get_preset_view("development")
+        assert view is get_preset_view("development")
+        assert view["APP_ENV"] == "development"
+        with pytest.raises(TypeError):
+            view["APP_ENV"] = "production"
+        # get_preset still hands out independent copies
+        assert get_preset("development") is not get_preset("development")
+
     def test_list_presets_function(self):
         """Test list_presets function."""
         presets = list_presets()
@@ -1,13 +1,22 @@
 """Tests for LLM providers."""
 
-import os
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, create_autospec, patch
 
 from shared_ai_utils.llm import LLMProvider, LLMResponse, AnthropicProvider, OpenAIProvider
 from shared_ai_utils.llm.manager import LLMManager
 
 
+@pytest.fixture(scope="session")
+def llm_provider_mock_factory():
+    """Build fresh LLMProvider autospec instances.
+
+    Each call returns a new mock, so child mocks are never shared between tests;
+    signatures are checked and async methods become AsyncMocks.
+    """
+    return lambda: create_autospec(LLMProvider, instance=True)
+
+
 class TestLLMResponse:
     """Test LLMResponse dataclass."""
 
@@ -38,9 +47,9 @@ class TestLLMResponse:
 class TestLLMProvider:
     """Test LLMProvider base class."""
 
-    def test_provider_initialization(self):
+    def test_provider_initialization(self, llm_provider_mock_factory):
         """Test provider initialization."""
-        provider = Mock(spec=LLMProvider)
+        provider = llm_provider_mock_factory()
         provider.api_key = "test-key"
         provider.model = "test-model"
         provider.base_url = None
@@ -48,57 +57,70 @@ class TestLLMProvider:
         assert provider.api_key == "test-key"
         assert provider.model == "test-model"
 
+    def test_provider_mock_factory_isolated(self, llm_provider_mock_factory):
+        """Test factory mocks honour the spec and do not share state."""
+        first = llm_provider_mock_factory()
+        second = llm_provider_mock_factory()
+        first.is_available.return_value = True
+
+        assert isinstance(first, LLMProvider)
+        assert second.is_available.return_value is not True
+        with pytest.raises(AttributeError):
+            first.not_a_provider_method
+        with pytest.raises(TypeError):
+            first.is_available("unexpected")
+
 
 class TestAnthropicProvider:
     """Test AnthropicProvider."""
 
-    def test_provider_name(self):
+    def test_provider_name(self, monkeypatch):
         """Test provider name."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            provider = AnthropicProvider()
-            assert provider.provider_name == "anthropic"
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        provider = AnthropicProvider()
+        assert provider.provider_name == "anthropic"
 
-    def test_is_available_with_key(self):
+    def test_is_available_with_key(self, monkeypatch):
         """Test availability check with API key."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            with patch("shared_ai_utils.llm.providers.anthropic"):
-                provider = AnthropicProvider()
-                assert provider.is_available() is True
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        with patch("shared_ai_utils.llm.providers.anthropic"):
+            provider = AnthropicProvider()
+            assert provider.is_available() is True
 
-    def test_is_available_without_key(self):
+    def test_is_available_without_key(self, monkeypatch):
         """Test availability check without API key."""
-        with patch.dict(os.environ, {}, clear=True):
-            # Mock the import to avoid ImportError
-            with patch("shared_ai_utils.llm.providers.anthropic"):
-                provider = AnthropicProvider(api_key=None)
-                # If no key, should not be available
-                assert provider.is_available() is False
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        # Mock the import to avoid ImportError
+        with patch("shared_ai_utils.llm.providers.anthropic"):
+            provider = AnthropicProvider(api_key=None)
+            # If no key, should not be available
+            assert provider.is_available() is False
 
     @pytest.mark.asyncio
-    async def test_complete(self):
+    async def test_complete(self, monkeypatch):
         """Test completion generation."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            # Mock the anthropic module and client
-            with patch("shared_ai_utils.llm.providers.anthropic") as mock_anthropic_module:
-                mock_anthropic_class = Mock()
-                mock_client = Mock()
-                mock_message = Mock()
-                mock_message.content = [Mock(text="Test response")]
-                mock_message.usage = Mock(input_tokens=10, output_tokens=20)
-                mock_client.messages.create = AsyncMock(return_value=mock_message)
-                mock_anthropic_class.return_value = mock_client
-                mock_anthropic_module.Anthropic = mock_anthropic_class
-
-                provider = AnthropicProvider()
-                response = await provider.complete(
-                    system_prompt="You are a helpful assistant",
-                    user_prompt="Hello",
-                )
-
-                assert isinstance(response, LLMResponse)
-                assert response.text == "Test response"
-                assert response.provider == "anthropic"
-                assert response.tokens_used == 30
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        # Mock the anthropic module and client
+        with patch("shared_ai_utils.llm.providers.anthropic") as mock_anthropic_module:
+            mock_anthropic_class = Mock()
+            mock_client = Mock()
+            mock_message = Mock()
+            mock_message.content = [Mock(text="Test response")]
+            mock_message.usage = Mock(input_tokens=10, output_tokens=20)
+            mock_client.messages.create = AsyncMock(return_value=mock_message)
+            mock_anthropic_class.return_value = mock_client
+            mock_anthropic_module.Anthropic = mock_anthropic_class
+
+            provider = AnthropicProvider()
+            response = await provider.complete(
+                system_prompt="You are a helpful assistant",
+                user_prompt="Hello",
+            )
+
+            assert isinstance(response, LLMResponse)
+            assert response.text == "Test response"
+            assert response.provider == "anthropic"
+            assert response.tokens_used == 30
 
 
 class TestLLMManager:
@@ -113,6 +135,8 @@ class TestLLMManager:
 
             manager = LLMManager()
             assert manager.preferred_provider == "anthropic"
+            # Providers are only constructed once something needs them
+            mock_anthropic.assert_not_called()
 
     def test_list_available_providers(self):
         """Test listing available providers."""
@@ -126,36 +150,45 @@ class TestLLMManager:
             providers = manager.list_available_providers()
             assert "anthropic" in providers
 
+    def test_availability_cached_until_refresh(self):
+        """Test availability is probed once and re-probed on refresh."""
+        with patch("shared_ai_utils.llm.manager.AnthropicProvider") as mock_anthropic:
+            mock_provider = Mock()
+            mock_provider.is_available.return_value = True
+            mock_anthropic.return_value = mock_provider
+
+            manager = LLMManager()
+            manager.list_available_providers()
+            manager.list_available_providers()
+            assert mock_provider.is_available.call_count == 1
+
+            mock_provider.is_available.return_value = False
+            manager.refresh()
+            assert "anthropic" not in manager.list_available_providers()
+            assert mock_provider.is_available.call_count == 2
+
     @pytest.mark.asyncio
-    async def test_generate_with_fallback(self):
+    async def test_generate_with_fallback(self, llm_provider_mock_factory):
         """Test generation with fallback."""
-        # Create real provider instances but mock their complete methods
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key", "OPENAI_API_KEY": "test-key"}):
-            manager = LLMManager(preferred_provider="anthropic")
-            
-            # Mock the providers' complete methods
-            if hasattr(manager, '_providers'):
-                for name, provider in manager._providers.items():
-                    if name == "anthropic":
-                        provider.complete = Mock(side_effect=Exception("Failed"))
-                    elif name == "openai":
-                        provider.complete = Mock(return_value=LLMResponse(
-                            text="Success",
-                            model="gpt-4",
-                            provider="openai",
-                            tokens_used=100,
-                        ))
-            
-            # If providers aren't available, skip this test
-            available = manager.list_available_providers()
-            if len(available) < 2:
-                pytest.skip("Need at least 2 providers available for fallback test")
-            
-            response = await manager.generate(
-                system_prompt="Test",
-                user_prompt="Hello",
-                fallback=True,
-            )
+        failing = llm_provider_mock_factory()
+        failing.complete.side_effect = Exception("Failed")
+        working = llm_provider_mock_factory()
+        working.complete.return_value = LLMResponse(
+            text="Success",
+            model="gpt-4",
+            provider="openai",
+            tokens_used=100,
+        )
+        manager = LLMManager(preferred_provider="anthropic")
+        manager.providers = {"anthropic": failing, "openai": working}
+
+        response = await manager.generate(
+            system_prompt="Test",
+            user_prompt="Hello",
+            fallback=True,
+        )
 
-            assert response.text == "Success"
-            assert response.provider == "openai"
+        assert response.text == "Success"
+        assert response.provider == "openai"
+        failing.complete.assert_awaited_once()
+        working.complete.assert_awaited_once()
@@ -1,9 +1,12 @@
 """Tests for metrics collector."""
 
+import json
+
 import pytest
 from datetime import datetime
+from enum import Enum
 
-from shared_ai_utils.metrics import MetricsCollector, MetricType
+from shared_ai_utils.metrics import AssessmentEntry, MetricsCollector, MetricType
 
 
 class TestMetricsCollector:
@@ -42,6 +45,44 @@ class TestMetricsCollector:
         assert entry["candidate_id"] == "test_candidate"
         assert entry["overall_score"] == 85.5
 
+    def test_assessment_entry_export(self, collector):
+        """Test slotted assessment entries export as plain dicts."""
+        collector.log_assessment(
+            candidate_id="test_candidate",
+            assessment_id="assess_123",
+            overall_score=85.5,
+            path_scores=[],
+            processing_time_ms=150.0,
+        )
+
+        entry = collector.data["assessments"][0]
+        assert isinstance(entry, AssessmentEntry)
+        assert entry.overall_score == 85.5
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(KeyError):
+            entry["missing"]
+
+        exported = collector.export_dict()["assessments"][0]
+        assert exported["assessment_id"] == "assess_123"
+        assert '"candidate_id": "test_candidate"' in collector.export_json()
+
+    def test_get_metrics_by_type_returns_list(self, collector):
+        """Test typed lookups return sliceable, JSON-ready lists."""
+        for i in range(3):
+            collector.log_assessment(
+                candidate_id=f"candidate_{i}",
+                assessment_id=f"assess_{i}",
+                overall_score=80.0 + i,
+                path_scores=[],
+                processing_time_ms=100.0,
+            )
+
+        assessments = collector.get_metrics_by_type(MetricType.ASSESSMENT)
+        assert isinstance(assessments, list)
+        assert [entry["assessment_id"] for entry in assessments[-2:]] == ["assess_1", "assess_2"]
+        assert json.loads(json.dumps(assessments))[0]["candidate_id"] == "candidate_0"
+        assert collector.get_metrics_by_type(MetricType.BUG) == []
+
     def test_log_api_request(self, collector):
         """Test logging API request metrics."""
         collector.log_api_request(
@@ -56,6 +97,39 @@ class TestMetricsCollector:
         assert entry["path"] == "/api/test"
         assert entry["status_code"] == 200
 
+    def test_llm_call_strings_shared(self, collector):
+        """Test repeated provider and model names are stored as one shared string."""
+        for _ in range(2):
+            # Build the names at runtime so each call passes distinct objects
+            collector.log_llm_call(
+                provider="".join(["open", "ai"]),
+                model="-".join(["gpt", "4o"]),
+                success=True,
+                duration_ms=1.0,
+            )
+
+        first, second = collector.data["llm_calls"]
+        assert first["provider"] is second["provider"]
+        assert first["model"] is second["model"]
+
+    def test_llm_call_accepts_enum_and_none(self, collector):
+        """Test str-Enum and None values are stored unchanged."""
+
+        class Provider(str, Enum):
+            OPENAI = "openai"
+
+        collector.log_llm_call(
+            provider=Provider.OPENAI, model=None, success=True, duration_ms=1.0
+        )
+        collector.log_api_request(
+            method=Provider.OPENAI, path="/api", status_code=200, response_time_ms=1.0
+        )
+
+        entry = collector.data["llm_calls"][0]
+        assert entry["provider"] is Provider.OPENAI
+        assert entry["model"] is None
+        assert collector.data["api_requests"][0]["method"] is Provider.OPENAI
+
     def test_log_error(self, collector):
         """Test logging error metrics."""
         collector.log_error(
@@ -119,3 +193,14 @@ class TestMetricsCollector:
         for category in collector.data:
             collector.data[category].clear()
         assert len(collector.data["assessments"]) == 0
+
+    def test_max_entries_per_category(self):
+        """Test bounded collectors keep only the most recent entries."""
+        collector = MetricsCollector(max_entries_per_category=2)
+        for i in range(3):
+            collector.log_error(error_type="ValueError", error_message=f"error {i}")
+
+        messages = [entry["error_message"] for entry in collector.data["errors"]]
+        assert messages == ["error 1", "error 2"]
+        assert collector.export_dict()["errors"][0]["error_message"] == "error 1"
+        assert '"error 2"' in collector.export_json()
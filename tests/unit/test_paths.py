@@ -0,0 +1,89 @@
+"""Tests for workspace path resolution."""
+
+from unittest.mock import patch
+
+import pytest
+
+from shared_ai_utils.utils import paths
+from shared_ai_utils.utils.paths import (
+    clear_workspace_cache,
+    find_workspace_root,
+    get_config_path,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Isolate cached lookups between tests."""
+    clear_workspace_cache()
+    yield
+    clear_workspace_cache()
+
+
+class TestFindWorkspaceRoot:
+    """Test find_workspace_root."""
+
+    def test_finds_workspace_config(self, tmp_path):
+        """Test the nearest directory with .workspace-config is returned."""
+        (tmp_path / ".workspace-config").mkdir()
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+
+        assert find_workspace_root(nested) == tmp_path.resolve()
+
+    def test_lookup_is_cached(self, tmp_path):
+        """Test a repeated lookup re-checks the cached root instead of walking again."""
+        (tmp_path / ".workspace-config").mkdir()
+        nested = tmp_path / "a" / "b" / "c"
+        nested.mkdir(parents=True)
+        find_workspace_root(nested)
+
+        with patch.object(paths.os.path, "exists", wraps=paths.os.path.exists) as exists:
+            assert find_workspace_root(nested) == tmp_path.resolve()
+
+        assert exists.call_count == 1
+
+    def test_root_created_after_first_miss(self, tmp_path, monkeypatch):
+        """Test a workspace created after a failed lookup is found."""
+        monkeypatch.chdir(tmp_path)
+        if find_workspace_root() is not None:
+            pytest.skip("temp directory is inside a workspace")
+
+        config_dir = paths.get_workspace_config_dir("app")
+
+        workspace = tmp_path.resolve() / ".workspace-config"
+        assert config_dir == workspace / "app"
+        assert find_workspace_root() == tmp_path.resolve()
+        assert get_config_path("app", fallback_home=True) == workspace / "app" / "config.yaml"
+
+    def test_deleted_marker_is_recreated(self, tmp_path, monkeypatch):
+        """Test a cached root is dropped once its marker directory is removed."""
+        monkeypatch.chdir(tmp_path)
+        marker = tmp_path / ".workspace-config"
+        marker.mkdir()
+        assert find_workspace_root() == tmp_path.resolve()
+
+        marker.rmdir()
+        paths.get_workspace_config_dir("app")
+        assert marker.is_dir()
+
+    def test_nested_marker_needs_cache_clear(self, tmp_path):
+        """Test a nearer marker added after caching is found once the cache is cleared."""
+        (tmp_path / ".workspace-config").mkdir()
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        assert find_workspace_root(nested) == tmp_path.resolve()
+
+        (tmp_path / "a" / ".workspace-config").mkdir()
+        assert find_workspace_root(nested) == tmp_path.resolve()
+
+        clear_workspace_cache()
+        assert find_workspace_root(nested) == (tmp_path / "a").resolve()
+
+    def test_get_config_path_uses_workspace(self, tmp_path, monkeypatch):
+        """Test config paths resolve inside the workspace config directory."""
+        (tmp_path / ".workspace-config").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        path = get_config_path("my-app", "settings.yaml")
+        assert path == tmp_path.resolve() / ".workspace-config" / "my-app" / "settings.yaml"
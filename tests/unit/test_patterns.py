@@ -1,11 +1,17 @@
 """Tests for pattern management."""
 
+import io
 import json
+import os
+import subprocess
+import sys
 import tempfile
+import uuid
 from pathlib import Path
 
 import pytest
 
+import shared_ai_utils
 from shared_ai_utils.patterns import PatternManager, PatternMemory
 
 
@@ -19,15 +25,20 @@ class TestPatternManager:
             yield f.name
         Path(f.name).unlink(missing_ok=True)
 
-    def test_pattern_manager_initialization(self, temp_file):
+    @pytest.fixture
+    def library(self):
+        """In-memory pattern library for tests that don't exercise the disk."""
+        return io.StringIO()
+
+    def test_pattern_manager_initialization(self, library):
         """Test pattern manager initialization."""
-        manager = PatternManager(pattern_library_path=temp_file)
+        manager = PatternManager(pattern_library_path=library)
         assert manager.patterns == []
         assert manager.changelog == []
 
-    def test_add_pattern(self, temp_file):
+    def test_add_pattern(self, library):
         """Test adding a pattern."""
-        manager = PatternManager(pattern_library_path=temp_file)
+        manager = PatternManager(pattern_library_path=library)
         pattern = manager.add_pattern(
             name="test_pattern",
             description="Test description",
@@ -39,6 +50,41 @@ class TestPatternManager:
         assert "pattern_id" in pattern
         assert len(manager.patterns) == 1
 
+    def test_pattern_ids_are_unique_uuids(self, library):
+        """Test pooled pattern IDs are unique version-4 UUIDs across refills."""
+        manager = PatternManager(pattern_library_path=library)
+        created = manager.add_patterns_bulk(
+            [{"name": f"p{i}", "description": "d", "good_example": "x"} for i in range(300)]
+        )
+
+        ids = [p["pattern_id"] for p in created]
+        assert len(set(ids)) == 300
+        assert all(uuid.UUID(pattern_id).version == 4 for pattern_id in ids)
+
+    def test_add_patterns_bulk(self, temp_file):
+        """Test adding patterns in bulk."""
+        manager = PatternManager(pattern_library_path=temp_file)
+        created = manager.add_patterns_bulk(
+            [
+                {"name": "first", "description": "First", "good_example": "a = 1"},
+                {
+                    "name": "second",
+                    "description": "Second",
+                    "good_example": "b = 2",
+                    "severity": "high",
+                    "tags": ["api"],
+                },
+            ],
+            save=True,
+        )
+
+        assert [p["name"] for p in created] == ["first", "second"]
+        assert created[1]["severity"] == "high"
+        assert len(manager.changelog) == 2
+
+        manager2 = PatternManager(pattern_library_path=temp_file)
+        assert len(manager2.patterns) == 2
+
     def test_save_and_load_patterns(self, temp_file):
         """Test saving and loading patterns."""
         manager = PatternManager(pattern_library_path=temp_file)
@@ -56,9 +102,38 @@ class TestPatternManager:
         assert len(manager2.patterns) == 1
         assert manager2.patterns[0]["name"] == "test_pattern"
 
-    def test_update_pattern(self, temp_file):
-        """Test updating a pattern."""
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_and_load_roundtrip_backends(self, temp_file, monkeypatch, use_orjson):
+        """Test the library round-trips with and without orjson."""
+        from shared_ai_utils.patterns import manager as manager_module
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(manager_module, "orjson", None)
+
         manager = PatternManager(pattern_library_path=temp_file)
+        manager.add_pattern(name="caf\u00e9", description="Test", good_example="x = 1")
+        manager.save_patterns()
+
+        loaded = PatternManager(pattern_library_path=temp_file)
+        assert loaded.patterns == manager.patterns
+        assert json.loads(Path(temp_file).read_text(encoding="utf-8"))["patterns"]
+
+    def test_file_like_library_roundtrip(self, library):
+        """Test a file-like library is written and re-read in place."""
+        manager = PatternManager(pattern_library_path=library)
+        manager.add_pattern(name="stream", description="In memory", good_example="x = 1")
+        manager.save_patterns()
+        manager.save_patterns()  # rewrites rather than appends
+
+        assert json.loads(library.getvalue())["patterns"][0]["name"] == "stream"
+        loaded = PatternManager(pattern_library_path=library)
+        assert [p["name"] for p in loaded.patterns] == ["stream"]
+
+    def test_update_pattern(self, library):
+        """Test updating a pattern."""
+        manager = PatternManager(pattern_library_path=library)
         pattern = manager.add_pattern(
             name="test_pattern",
             description="Old description",
@@ -72,9 +147,9 @@ class TestPatternManager:
         assert updated["description"] == "New description"
         assert updated["pattern_id"] == pattern["pattern_id"]
 
-    def test_remove_pattern(self, temp_file):
+    def test_remove_pattern(self, library):
         """Test removing a pattern."""
-        manager = PatternManager(pattern_library_path=temp_file)
+        manager = PatternManager(pattern_library_path=library)
         pattern = manager.add_pattern(
             name="test_pattern",
             description="Test",
@@ -85,9 +160,65 @@ class TestPatternManager:
         assert result is True
         assert len(manager.patterns) == 0
 
-    def test_archive_pattern(self, temp_file):
+    def test_get_pattern_by_id_after_reload_and_remove(self, library):
+        """Test ID lookups follow loading and removal."""
+        manager = PatternManager(pattern_library_path=library)
+        pattern = manager.add_pattern(name="p", description="d", good_example="x")
+        manager.save_patterns()
+
+        loaded = PatternManager(pattern_library_path=library)
+        assert loaded.get_pattern(pattern["pattern_id"]) == pattern
+
+        assert loaded.remove_pattern(pattern["pattern_id"]) is True
+        assert loaded.get_pattern(pattern["pattern_id"]) is None
+        assert loaded.remove_pattern(pattern["pattern_id"]) is False
+
+    def test_load_pattern_with_null_fields(self, library):
+        """Test library entries with null name, description or tags still load."""
+        library.write(
+            json.dumps(
+                {
+                    "patterns": [
+                        {"pattern_id": "p1", "name": None, "description": None, "tags": None},
+                        {"pattern_id": "p2", "name": "api", "description": "API", "tags": None},
+                    ]
+                }
+            )
+        )
+        library.seek(0)
+
+        manager = PatternManager(pattern_library_path=library)
+        assert manager.get_pattern("p1")["name"] is None
+        assert [p["pattern_id"] for p in manager.suggest_patterns("api")] == ["p2"]
+        assert manager.remove_pattern("p1") is True
+
+    def test_patterns_without_or_sharing_ids_are_suggested(self, library):
+        """Test legacy entries without an id, or with a repeated id, stay searchable."""
+        library.write(
+            json.dumps(
+                {
+                    "patterns": [
+                        {"name": "legacy api", "description": "No id"},
+                        {"pattern_id": "dup", "name": "api one", "description": "First"},
+                        {"pattern_id": "dup", "name": "api two", "description": "Second"},
+                    ]
+                }
+            )
+        )
+        library.seek(0)
+
+        manager = PatternManager(pattern_library_path=library)
+        names = {p["name"] for p in manager.suggest_patterns("api")}
+        assert names == {"legacy api", "api one", "api two"}
+
+        assert manager.get_pattern("dup")["name"] == "api one"
+        assert manager.remove_pattern("dup") is True
+        assert manager.get_pattern("dup")["name"] == "api two"
+        assert {p["name"] for p in manager.suggest_patterns("api")} == {"legacy api", "api two"}
+
+    def test_archive_pattern(self, library):
         """Test archiving a pattern."""
-        manager = PatternManager(pattern_library_path=temp_file)
+        manager = PatternManager(pattern_library_path=library)
         pattern = manager.add_pattern(
             name="test_pattern",
             description="Test",
@@ -99,9 +230,9 @@ class TestPatternManager:
         assert pattern["archived"] is True
         assert "archived_at" in pattern
 
-    def test_suggest_patterns(self, temp_file):
+    def test_suggest_patterns(self, library):
         """Test pattern suggestions."""
-        manager = PatternManager(pattern_library_path=temp_file)
+        manager = PatternManager(pattern_library_path=library)
         manager.add_pattern(
             name="api_pattern",
             description="API endpoint pattern",
@@ -113,9 +244,34 @@ class TestPatternManager:
         assert len(suggestions) > 0
         assert suggestions[0]["name"] == "api_pattern"
 
-    def test_get_pattern_effectiveness(self, temp_file):
+    def test_suggest_patterns_ranking_and_index_updates(self, library):
+        """Test suggestions rank by overlap and follow updates and removals."""
+        manager = PatternManager(pattern_library_path=library)
+        cache = manager.add_pattern(
+            name="cache_pattern",
+            description="Cache expensive lookups",
+            good_example="@lru_cache",
+        )
+        api = manager.add_pattern(
+            name="api_errors",
+            description="Handle API errors in endpoint handlers",
+            good_example="raise HTTPException()",
+            tags=["api"],
+        )
+
+        assert manager.suggest_patterns("api endpoint errors") == [api]
+        assert manager.suggest_patterns("unrelated") == []
+
+        manager.update_pattern(cache["pattern_id"], description="Cache endpoint responses")
+        assert manager.suggest_patterns("endpoint") == [api, cache]
+        assert manager.suggest_patterns("expensive") == []
+
+        manager.remove_pattern(api["pattern_id"])
+        assert manager.suggest_patterns("api endpoint") == [cache]
+
+    def test_get_pattern_effectiveness(self, library):
         """Test getting pattern effectiveness."""
-        manager = PatternManager(pattern_library_path=temp_file)
+        manager = PatternManager(pattern_library_path=library)
         pattern = manager.add_pattern(
             name="test_pattern",
             description="Test",
@@ -125,9 +281,9 @@ class TestPatternManager:
         effectiveness = manager.get_pattern_effectiveness(pattern["pattern_id"])
         assert effectiveness == 0.5  # Default
 
-    def test_update_pattern_effectiveness(self, temp_file):
+    def test_update_pattern_effectiveness(self, library):
         """Test updating pattern effectiveness."""
-        manager = PatternManager(pattern_library_path=temp_file)
+        manager = PatternManager(pattern_library_path=library)
         pattern = manager.add_pattern(
             name="test_pattern",
             description="Test",
@@ -176,3 +332,189 @@ class TestPatternMemory:
         result = await memory.retrieve_patterns("test query")
         # Should return None if MemU not available
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_memorize_patterns_preserves_order(self):
+        """Test batch memorization keeps input order and isolates failures."""
+
+        class FakeMemU:
+            async def memorize(self, resource):
+                name = resource["metadata"]["pattern_name"]
+                if name == "bad":
+                    raise RuntimeError("boom")
+                return {"stored": name}
+
+        memory = PatternMemory()
+        memory._memu_available = True
+        memory._initialized = True
+        memory._memory = FakeMemU()
+
+        names = ["p0", "bad", "p2", "p3", "p4"]
+        results = await memory.memorize_patterns(
+            [{"name": n, "description": "d"} for n in names], batch_size=2
+        )
+
+        assert results == [
+            {"stored": "p0"},
+            None,
+            {"stored": "p2"},
+            {"stored": "p3"},
+            {"stored": "p4"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_memorize_patterns_rejects_misaligned_batch(self):
+        """Test a batch response of the wrong length is not matched to inputs."""
+
+        class FakeMemU:
+            def __init__(self):
+                self.single_calls = 0
+
+            async def memorize_batch(self, resources):
+                names = [r["metadata"]["pattern_name"] for r in resources]
+                if "short" in names:
+                    return [{"stored": names[0]}]
+                return [{"stored": name} for name in names]
+
+            async def memorize(self, resource):
+                self.single_calls += 1
+                return {"stored": resource["metadata"]["pattern_name"]}
+
+        memory = PatternMemory()
+        memory._memu_available = True
+        memory._initialized = True
+        memory._memory = FakeMemU()
+
+        names = ["p0", "p1", "short", "p3"]
+        results = await memory.memorize_patterns(
+            [{"name": n, "description": "d"} for n in names], batch_size=2
+        )
+
+        assert results == [{"stored": "p0"}, {"stored": "p1"}, None, None]
+        assert memory._memory.single_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_retrieve_patterns_reuses_query_embedding(self):
+        """Test repeated queries skip the embedding call."""
+
+        class FakeMemU:
+            embed_calls = 0
+
+            async def embed_query(self, query):
+                FakeMemU.embed_calls += 1
+                return [0.1, 0.2]
+
+            async def search_by_vector(self, vector, limit, filters):
+                return {"results": [{"vector": vector}]}
+
+        memory = PatternMemory()
+        memory._memu_available = True
+        memory._initialized = True
+        memory._memory = FakeMemU()
+
+        first = await memory.retrieve_patterns("api errors")
+        second = await memory.retrieve_patterns("api errors")
+
+        assert first == second == {"results": [{"vector": (0.1, 0.2)}]}
+        assert FakeMemU.embed_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_recommend_patterns_semantic_cache(self):
+        """Test near-duplicate contexts are served from the semantic cache."""
+        pytest.importorskip("numpy")
+
+        class FakeMemU:
+            searches = 0
+            vectors = {
+                "handle api errors": [1.0, 0.0, 0.0],
+                "handling API errors": [0.99, 0.05, 0.0],
+                "database migrations": [0.0, 0.0, 1.0],
+            }
+
+            async def embed_query(self, query):
+                return self.vectors[query]
+
+            async def search_by_vector(self, vector, limit, filters):
+                FakeMemU.searches += 1
+                return {"results": [{"name": f"result_{FakeMemU.searches}"}]}
+
+        memory = PatternMemory()
+        memory._memu_available = True
+        memory._initialized = True
+        memory._memory = FakeMemU()
+
+        first = await memory.recommend_patterns("handle api errors")
+        rephrased = await memory.recommend_patterns("handling API errors")
+        unrelated = await memory.recommend_patterns("database migrations")
+
+        assert rephrased == first
+        assert unrelated != first
+        assert FakeMemU.searches == 2
+
+        first[0]["name"] = "mutated"
+        rephrased[0]["extra"] = True
+        rephrased.append({"name": "appended"})
+        again = await memory.recommend_patterns("handling API errors")
+        assert again == [{"name": "result_1"}]
+
+    @pytest.mark.asyncio
+    async def test_memorize_invalidates_semantic_cache(self):
+        """Test newly stored patterns are visible to previously cached queries."""
+        pytest.importorskip("numpy")
+
+        class FakeMemU:
+            searches = 0
+
+            async def embed_query(self, query):
+                return [1.0, 0.0, 0.0]
+
+            async def search_by_vector(self, vector, limit, filters):
+                FakeMemU.searches += 1
+                return {"results": [{"name": f"result_{FakeMemU.searches}"}]}
+
+            async def memorize(self, resource):
+                return {"stored": resource["metadata"]["pattern_name"]}
+
+        memory = PatternMemory()
+        memory._memu_available = True
+        memory._initialized = True
+        memory._memory = FakeMemU()
+
+        await memory.recommend_patterns("handle api errors")
+        await memory.recommend_patterns("handle api errors")
+        assert FakeMemU.searches == 1
+
+        await memory.memorize_pattern({"name": "new", "description": "d"})
+        await memory.recommend_patterns("handle api errors")
+        assert FakeMemU.searches == 2
+
+        await memory.memorize_patterns([{"name": "batch", "description": "d"}])
+        await memory.recommend_patterns("handle api errors")
+        assert FakeMemU.searches == 3
+
+    def test_import_does_not_load_numeric_extras(self):
+        """Test NumPy and Numba are only loaded once the semantic cache is used."""
+        code = (
+            "import sys, shared_ai_utils; "
+            "print('numba' in sys.modules, 'numpy' in sys.modules)"
+        )
+        src_dir = str(Path(shared_ai_utils.__file__).resolve().parents[1])
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": src_dir},
+        )
+        assert result.stdout.strip() == "False False"
+
+    def test_extract_tags_does_not_mutate_pattern(self):
+        """Test tag extraction leaves the pattern's tag list untouched."""
+        memory = PatternMemory()
+        pattern = {"name": "test", "tags": ["api"], "severity": "high"}
+
+        first = memory._extract_tags(pattern)
+        second = memory._extract_tags(pattern)
+
+        assert first == second == ["api", "severity:high"]
+        assert pattern["tags"] == ["api"]
@@ -1,54 +1,60 @@
 """Tests for rules builder."""
 
-import tempfile
-from pathlib import Path
+import os
 
 import pytest
 
-from shared_ai_utils.rules.builder import RuleBuilder, HEADER
+from shared_ai_utils.rules.builder import RuleBuilder, HEADER, HEADER_BYTES
 
 
 class TestRuleBuilder:
     """Test RuleBuilder."""
 
-    def test_builder_initialization(self):
+    def test_builder_initialization(self, default_rule_builder):
         """Test RuleBuilder initialization."""
-        builder = RuleBuilder()
-        assert builder.rules_dir is not None
-        assert builder.rules_dir.exists()
+        assert default_rule_builder.rules_dir is not None
+        assert default_rule_builder.rules_dir.exists()
+        # The default directory is resolved once and shared
+        assert RuleBuilder().rules_dir is default_rule_builder.rules_dir
 
-    def test_builder_initialization_with_custom_dir(self):
-        """Test RuleBuilder with custom directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            builder = RuleBuilder(rules_dir=tmpdir)
-            assert builder.rules_dir == Path(tmpdir)
-
-    def test_build_with_existing_rules(self):
+    def test_build_with_existing_rules(self, default_built_content):
         """Test building rules with existing rule files."""
-        builder = RuleBuilder()
-        content = builder.build()
-        
         # Should include header
-        assert HEADER in content
+        assert HEADER in default_built_content
         # Should be a non-empty string
-        assert len(content) > len(HEADER)
-
-    def test_build_with_missing_rules(self):
-        """Test building rules with missing rule files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            builder = RuleBuilder(rules_dir=tmpdir)
-            content = builder.build()
-            
-            # Should still include header even if no rules
-            assert HEADER in content
-
-    def test_write_to_file(self):
+        assert len(default_built_content) > len(HEADER)
+
+    def test_custom_empty_dir(self, tmp_path):
+        """Test RuleBuilder with a custom directory that has no rule files."""
+        builder = RuleBuilder(rules_dir=str(tmp_path))
+        assert builder.rules_dir == tmp_path
+
+        # Should still include header even if no rules
+        assert HEADER in builder.build()
+
+    def test_write_to_file(self, default_rule_builder, default_built_content, tmp_path_factory):
         """Test writing rules to file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.md"
-            builder = RuleBuilder()
-            builder.write_to_file(str(output_path))
-            
-            assert output_path.exists()
-            content = output_path.read_text()
-            assert HEADER in content
+        output_path = tmp_path_factory.mktemp("rules_out", numbered=False) / "output.md"
+        default_rule_builder.write_to_file(str(output_path))
+
+        # Compare raw bytes so the assertion needs no decode pass
+        raw = output_path.read_bytes()
+        assert raw.startswith(HEADER_BYTES)
+        assert raw == default_built_content.encode("utf-8")
+
+    def test_build_picks_up_modified_rules(self, tmp_path):
+        """Test cached rule content is refreshed when a file changes."""
+        rule_file = tmp_path / "core" / "00-prime-directives.md"
+        rule_file.parent.mkdir()
+        rule_file.write_text("First version", encoding="utf-8")
+
+        builder = RuleBuilder(rules_dir=str(tmp_path))
+        assert "First version" in builder.build()
+
+        rule_file.write_text("Second version", encoding="utf-8")
+        stat = rule_file.stat()
+        os.utime(rule_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        content = builder.build()
+        assert "Second version" in content
+        assert "First version" not in content
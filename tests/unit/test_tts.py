@@ -1,17 +1,88 @@
 """Tests for TTS (Text-to-Speech) providers and manager."""
 
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import MagicMock, Mock, patch, AsyncMock
 
 from shared_ai_utils.tts import (
     TTSProvider,
     TTSResponse,
     ElevenLabsTTSProvider,
     OpenAITTSProvider,
+    CachingTTSMixin,
     TTSManager,
 )
 
 
+# Tests that build providers from the environment need at least one real key
+_HAS_TTS_KEY = bool(os.getenv("ELEVENLABS_API_KEY") or os.getenv("OPENAI_API_KEY"))
+
+# Canned audio and provider responses shared across tests; nothing mutates them
+_FAKE_AUDIO = b"fake_audio_data"
+_FAKE_OPENAI_RESPONSE = TTSResponse(audio_data=b"audio", format="mp3", provider="openai")
+_FAKE_ELEVENLABS_RESPONSE = TTSResponse(audio_data=b"audio", provider="elevenlabs")
+
+
+class _FakeStreamResponse:
+    """Minimal streamed httpx response: a status code and one body chunk."""
+
+    def __init__(self, body, status_code):
+        self.status_code = status_code
+        self._body = body
+
+    async def aiter_bytes(self, chunk_size=None):
+        yield self._body
+
+
+class _FakeStream:
+    """Async context manager returned by the fake client's stream()."""
+
+    def __init__(self, response):
+        self._response = response
+
+    async def __aenter__(self):
+        return self._response
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def _streaming_client(body=_FAKE_AUDIO, status_code=200):
+    """Build a fake HTTP client whose stream() returns a canned response."""
+    stream = Mock(return_value=_FakeStream(_FakeStreamResponse(body, status_code)))
+    return SimpleNamespace(is_closed=False, stream=stream)
+
+
+@pytest.fixture
+def mock_httpx_ok(monkeypatch):
+    """Route the shared provider client to a canned 200 streaming response."""
+    from shared_ai_utils.tts import providers
+
+    client = _streaming_client()
+    mock_httpx = MagicMock()
+    mock_httpx.AsyncClient.return_value = client
+    monkeypatch.setattr(providers, "httpx", mock_httpx)
+    monkeypatch.setattr(providers, "_shared_client", None)
+    return client
+
+
+async def _fake_openai_generate(*args, **kwargs):
+    return _FAKE_OPENAI_RESPONSE
+
+
+# Provider stubs for manager fallback tests, built once per module
+_ELEVENLABS_DOWN = SimpleNamespace(provider_name="elevenlabs", is_available=lambda: False)
+_OPENAI_UP = SimpleNamespace(
+    provider_name="openai",
+    is_available=lambda: True,
+    generate_speech=_fake_openai_generate,
+)
+
+
 class TestTTSResponse:
     """Test TTSResponse dataclass."""
 
@@ -23,105 +94,502 @@ class TestTTSResponse:
             provider="elevenlabs",
             model="eleven_multilingual_v2",
         )
-        assert response.audio_data == b"fake_audio_data"
-        assert response.format == "mp3"
-        assert response.provider == "elevenlabs"
-        assert response.model == "eleven_multilingual_v2"
+        assert (response.audio_data, response.format, response.provider, response.model) == (
+            b"fake_audio_data",
+            "mp3",
+            "elevenlabs",
+            "eleven_multilingual_v2",
+        )
 
 
+class TestProviderAvailability:
+    """Test provider names and API-key availability checks."""
+
+    @pytest.mark.parametrize(
+        "provider_class,name",
+        [(ElevenLabsTTSProvider, "elevenlabs"), (OpenAITTSProvider, "openai")],
+    )
+    @pytest.mark.parametrize("api_key,expected", [("test-key", True), (None, False)])
+    def test_provider_availability(self, provider_class, name, api_key, expected):
+        """Test provider name and availability with and without an API key."""
+        provider = provider_class(api_key=api_key)
+        assert provider.provider_name == name
+        assert provider.is_available() is expected
+
+
+@pytest.mark.xdist_group(name="elevenlabs")
 class TestElevenLabsTTSProvider:
     """Test ElevenLabsTTSProvider."""
 
-    def test_provider_name(self):
-        """Test provider name."""
+    @pytest.mark.asyncio
+    async def test_generate_speech(self, mock_httpx_ok):
+        """Test text synthesis."""
         provider = ElevenLabsTTSProvider(api_key="test-key")
-        assert provider.provider_name == "elevenlabs"
 
-    def test_is_available_with_key(self):
-        """Test availability check with API key."""
+        response = await provider.generate_speech("Hello, world!")
+
+        assert isinstance(response, TTSResponse)
+        assert response.audio_data == _FAKE_AUDIO
+        assert response.provider == "elevenlabs"
+        mock_httpx_ok.stream.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_generate_speech_uses_injected_client(self):
+        """Test a shared HTTP client is reused instead of creating one per call."""
+        http_client = _streaming_client()
+        provider = ElevenLabsTTSProvider(api_key="test-key", http_client=http_client)
+
+        with patch("shared_ai_utils.tts.providers.httpx") as mock_httpx:
+            response = await provider.generate_speech("Hello, world!")
+
+        assert response.audio_data == _FAKE_AUDIO
+        http_client.stream.assert_called_once()
+        body = json.loads(http_client.stream.call_args.kwargs["content"])
+        assert body["text"] == "Hello, world!"
+        mock_httpx.AsyncClient.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_speech_cancellable(self):
+        """Test a cancelled request is abandoned and a completed one is returned."""
         provider = ElevenLabsTTSProvider(api_key="test-key")
-        assert provider.is_available() is True
+        started = asyncio.Event()
+        aborted = asyncio.Event()
 
-    def test_is_available_without_key(self):
-        """Test availability check without API key."""
+        async def slow_generate(text, voice=None, model=None):
+            started.set()
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                aborted.set()
+                raise
+
+        provider.generate_speech = slow_generate
+        cancel_event = asyncio.Event()
+
+        async def barge_in():
+            await started.wait()
+            cancel_event.set()
+
+        result, _ = await asyncio.gather(
+            provider.generate_speech_cancellable("Hello", cancel_event=cancel_event),
+            barge_in(),
+        )
+        assert result is None
+        assert aborted.is_set()
+
+        provider.generate_speech = AsyncMock(return_value=_FAKE_ELEVENLABS_RESPONSE)
+        response = await provider.generate_speech_cancellable(
+            "Hello", cancel_event=asyncio.Event()
+        )
+        assert response.audio_data == b"audio"
+
+    @pytest.mark.asyncio
+    async def test_generate_speech_error_log_is_capped(self, caplog):
+        """Test large error bodies are truncated in the log message."""
+        http_client = _streaming_client(body=b"x" * 10_000, status_code=500)
+        provider = ElevenLabsTTSProvider(api_key="test-key", http_client=http_client)
+
+        with pytest.raises(Exception, match="ElevenLabs API error: 500"):
+            await provider.generate_speech("Hello")
+
+        record = next(r for r in caplog.records if r.getMessage().startswith("ElevenLabs TTS"))
+        assert record.getMessage() == "ElevenLabs TTS error 500: " + "x" * 512
+
+    @pytest.mark.asyncio
+    async def test_list_voices_cached(self):
+        """Test the voice catalog is fetched once within the TTL."""
+        mock_response = SimpleNamespace(
+            status_code=200,
+            content=b'{"voices": [{"voice_id": "v1", "name": "Voice One", "category": "cloned"}]}',
+        )
+        http_client = Mock()
+        http_client.get = AsyncMock(return_value=mock_response)
+        provider = ElevenLabsTTSProvider(api_key="test-key", http_client=http_client)
+
+        first = await provider.list_voices()
+        second = await provider.list_voices()
+
+        assert first == second
+        assert first[0]["id"] == "v1"
+        http_client.get.assert_awaited_once()
+
+        first[0]["id"] = "mutated"
+        assert (await provider.list_voices())[0]["id"] == "v1"
+
+        provider._voices_cache_expiry = 0.0
+        await provider.list_voices()
+        assert http_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_default_voices_are_plain_dicts(self, monkeypatch):
+        """Test default voices serialize to JSON and do not share state."""
+        monkeypatch.delenv("ELEVENLABS_API_KEY", raising=False)
         provider = ElevenLabsTTSProvider(api_key=None)
-        assert provider.is_available() is False
+        voices = await provider.list_voices()
+
+        assert all(type(voice) is dict for voice in voices)
+        assert json.loads(json.dumps(voices)) == voices
+
+        voices[0]["name"] = "mutated"
+        assert (await provider.list_voices())[0]["name"] != "mutated"
 
     @pytest.mark.asyncio
-    async def test_generate_speech(self):
-        """Test text synthesis."""
-        provider = ElevenLabsTTSProvider(api_key="test-key")
-        
-        with patch("shared_ai_utils.tts.providers.httpx") as mock_httpx:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.content = b"fake_audio_data"
-            mock_async_client = AsyncMock()
-            mock_async_client.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
-            mock_httpx.AsyncClient.return_value = mock_async_client
+    async def test_prefetch_chunks_batches_and_propagates_errors(self):
+        """Test prefetched chunks are joined in order and reader errors surface."""
+        from shared_ai_utils.tts.providers import _prefetch_chunks
 
-            response = await provider.generate_speech("Hello, world!")
+        async def chunks():
+            for chunk in (b"a", b"", b"b", b"c"):
+                yield chunk
+
+        assert b"".join([c async for c in _prefetch_chunks(chunks(), maxsize=2)]) == b"abc"
+
+        async def failing():
+            yield b"a"
+            await asyncio.sleep(0)
+            raise RuntimeError("connection reset")
+
+        with pytest.raises(RuntimeError, match="connection reset"):
+            async for _ in _prefetch_chunks(failing()):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_prefetch_chunks_delivers_before_error_and_closes_source(self):
+        """Test chunks read before a failure are yielded and the reader is closed."""
+        from shared_ai_utils.tts.providers import _prefetch_chunks
+
+        async def failing():
+            yield b"a"
+            yield b"b"
+            raise RuntimeError("connection reset")
+
+        received = []
+        with pytest.raises(RuntimeError, match="connection reset"):
+            async for chunk in _prefetch_chunks(failing()):
+                received.append(chunk)
+        assert b"".join(received) == b"ab"
+
+        async def cancelled():
+            yield b"a"
+            raise asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            async for _ in _prefetch_chunks(cancelled()):
+                pass
+
+        closed = asyncio.Event()
+
+        async def endless():
+            try:
+                while True:
+                    yield b"x"
+            finally:
+                closed.set()
+
+        stream = _prefetch_chunks(endless(), maxsize=1)
+        assert await stream.__anext__()
+        await stream.aclose()
+        assert closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_shared_client_reused_across_calls(self, monkeypatch):
+        """Test providers without an injected client share one module-level client."""
+        from shared_ai_utils.tts import providers
 
-            assert isinstance(response, TTSResponse)
-            assert response.audio_data == b"fake_audio_data"
-            assert response.provider == "elevenlabs"
+        monkeypatch.setattr(providers, "_shared_client", None)
+        first = await providers._get_client()
+        second = await providers._get_client()
+        assert first is second
 
+        await providers.close_shared_client()
+        assert first.is_closed
+        assert providers._shared_client is None
 
+    @pytest.mark.asyncio
+    async def test_stale_loop_client_closed(self, monkeypatch):
+        """Test a client from another event loop is closed before it is replaced."""
+        from shared_ai_utils.tts import providers
+
+        stale = Mock(is_closed=False)
+        stale.aclose = AsyncMock()
+        monkeypatch.setattr(providers, "_shared_client", stale)
+        monkeypatch.setattr(providers, "_shared_client_loop", object())
+
+        client = await providers._get_client()
+        assert client is not stale
+        stale.aclose.assert_awaited_once()
+        await providers.close_shared_client()
+
+
+@pytest.mark.xdist_group(name="openai")
 class TestOpenAITTSProvider:
     """Test OpenAITTSProvider."""
 
-    def test_provider_name(self):
-        """Test provider name."""
+    @pytest.mark.asyncio
+    async def test_stream_speech_chunks_without_delay(self):
+        """Test pseudo-streaming slices the generated audio without sleeping."""
+        provider = OpenAITTSProvider(api_key="test-key")
+        audio = bytes(range(256)) * 600
+        provider.generate_speech = AsyncMock(
+            return_value=TTSResponse(audio_data=audio, format="mp3", provider="openai")
+        )
+
+        with patch("shared_ai_utils.tts.providers.asyncio.sleep") as mock_sleep:
+            chunks = [chunk async for chunk in provider.stream_speech("Hello")]
+
+        assert b"".join(chunks) == audio
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_voices_are_plain_dicts(self):
+        """Test OpenAI voices serialize to JSON."""
         provider = OpenAITTSProvider(api_key="test-key")
-        assert provider.provider_name == "openai"
+        voices = await provider.list_voices()
+
+        assert all(type(voice) is dict for voice in voices)
+        assert json.loads(json.dumps(voices)) == voices
 
-    def test_is_available_with_key(self):
-        """Test availability check with API key."""
+    @pytest.mark.asyncio
+    async def test_stream_speech_single_chunk(self):
+        """Test chunk_size <= 0 yields the whole buffer at once."""
         provider = OpenAITTSProvider(api_key="test-key")
-        assert provider.is_available() is True
+        audio = b"a" * 200_000
+        provider.generate_speech = AsyncMock(
+            return_value=TTSResponse(audio_data=audio, format="mp3", provider="openai")
+        )
 
-    def test_is_available_without_key(self):
-        """Test availability check without API key."""
-        provider = OpenAITTSProvider(api_key=None)
-        assert provider.is_available() is False
+        chunks = [chunk async for chunk in provider.stream_speech("Hello", chunk_size=0)]
+        assert chunks == [audio]
+
+        chunks = [chunk async for chunk in provider.stream_speech("Hello", chunk_size=65536)]
+        assert [len(c) for c in chunks] == [65536, 65536, 65536, 3392]
 
 
 class TestTTSManager:
     """Test TTSManager."""
 
-    def test_manager_initialization(self):
+    @pytest.mark.skipif(not _HAS_TTS_KEY, reason="No TTS API key in environment")
+    def test_manager_initialization(self, default_tts_manager):
         """Test manager initialization."""
-        manager = TTSManager()
+        manager = default_tts_manager
         assert manager.primary_provider is not None or manager.fallback_provider is not None
 
-    def test_is_available(self):
+    def test_is_available(self, default_tts_manager):
         """Test availability check."""
-        manager = TTSManager()
         # May or may not be available depending on API keys
-        assert isinstance(manager.is_available(), bool)
+        assert isinstance(default_tts_manager.is_available(), bool)
+
+    def test_manager_uses_lazy_shared_client(self, monkeypatch):
+        """Test constructing a manager opens no HTTP client of its own."""
+        from shared_ai_utils.tts import providers
+
+        monkeypatch.setattr(providers, "_shared_client", None)
+        manager = TTSManager(elevenlabs_api_key="test-key", openai_api_key="test-key")
+
+        assert manager.primary_provider._http_client is None
+        assert manager.fallback_provider._http_client is None
+        assert providers._shared_client is None
 
     @pytest.mark.asyncio
-    async def test_generate_speech_with_fallback(self):
+    async def test_manager_aclose_keeps_shared_client(self, monkeypatch):
+        """Test closing one manager does not close the pool other callers share."""
+        from shared_ai_utils.tts import providers
+
+        monkeypatch.setattr(providers, "_shared_client", None)
+        client = await providers._get_client()
+        manager = TTSManager(elevenlabs_api_key="test-key", openai_api_key="test-key")
+
+        await manager.aclose()
+        assert not client.is_closed
+        assert await providers._get_client() is client
+        await providers.close_shared_client()
+
+    def test_refresh_availability(self):
+        """Test cached availability is re-checked on demand."""
+        manager = TTSManager(elevenlabs_api_key="test-key", openai_api_key="test-key")
+        assert manager.is_available() is True
+
+        manager.primary_provider.is_available = Mock(return_value=False)
+        manager.fallback_provider.is_available = Mock(return_value=False)
+        assert manager.is_available() is True  # Cached until refreshed
+
+        manager.refresh_availability()
+        assert manager.is_available() is False
+
+    @pytest.mark.asyncio
+    async def test_generate_speech_with_fallback(self, monkeypatch):
         """Test speech generation with fallback."""
-        # Create manager with mocked providers
-        with patch("shared_ai_utils.tts.manager.ElevenLabsTTSProvider") as mock_elevenlabs_class, \
-             patch("shared_ai_utils.tts.manager.OpenAITTSProvider") as mock_openai_class:
-            
-            mock_elevenlabs = Mock()
-            mock_elevenlabs.is_available.return_value = False
-            mock_elevenlabs_class.return_value = mock_elevenlabs
-            
-            mock_openai = Mock()
-            mock_openai.is_available.return_value = True
-            mock_openai.generate_speech = AsyncMock(return_value=TTSResponse(
-                audio_data=b"audio",
-                format="mp3",
-                provider="openai",
-            ))
-            mock_openai_class.return_value = mock_openai
-
-            manager = TTSManager(primary_provider="elevenlabs", fallback_provider="openai")
-            response = await manager.generate_speech("Hello")
-
-            assert response.provider == "openai"
-            assert response.audio_data == b"audio"
+        monkeypatch.setitem(
+            TTSManager.PROVIDER_MAP, "elevenlabs", lambda *args, **kwargs: _ELEVENLABS_DOWN
+        )
+        monkeypatch.setitem(TTSManager.PROVIDER_MAP, "openai", lambda *args, **kwargs: _OPENAI_UP)
+
+        manager = TTSManager(primary_provider="elevenlabs", fallback_provider="openai")
+        response = await manager.generate_speech("Hello")
+
+        assert response.provider == "openai"
+        assert response.audio_data == b"audio"
+
+    @pytest.mark.asyncio
+    async def test_generate_speech_uses_audio_cache(self):
+        """Test repeated requests are served from the audio cache."""
+        manager = TTSManager(elevenlabs_api_key="test-key", openai_api_key="test-key")
+        manager.primary_provider.generate_speech = AsyncMock(return_value=_FAKE_ELEVENLABS_RESPONSE)
+
+        first = await manager.generate_speech("Hello")
+        second = await manager.generate_speech("Hello")
+        await manager.generate_speech("Hello", voice="other")
+
+        assert first.audio_data == second.audio_data == b"audio"
+        assert manager.primary_provider.generate_speech.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_speech_hedged(self):
+        """Test a slow primary is raced against the fallback."""
+        manager = TTSManager(
+            elevenlabs_api_key="test-key", openai_api_key="test-key", hedge_delay=0.01
+        )
+        primary_cancelled = False
+
+        async def slow_primary(*args):
+            nonlocal primary_cancelled
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                primary_cancelled = True
+                raise
+
+        manager.primary_provider.generate_speech = slow_primary
+        manager.fallback_provider.generate_speech = AsyncMock(return_value=_FAKE_OPENAI_RESPONSE)
+
+        response = await manager.generate_speech("Hello")
+
+        assert response.provider == "openai"
+        assert primary_cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_stream_speech_coalesces_chunks(self):
+        """Test small streamed chunks are merged before being yielded."""
+        manager = TTSManager(elevenlabs_api_key="test-key", openai_api_key="test-key")
+
+        async def tiny_chunks(*args):
+            for _ in range(100):
+                yield b"x" * 50
+
+        manager.primary_provider.stream_speech = tiny_chunks
+
+        chunks = [chunk async for chunk in manager.stream_speech("Hello")]
+
+        assert b"".join(chunks) == b"x" * 5000
+        assert len(chunks) < 10
+
+    @pytest.mark.asyncio
+    async def test_coalesce_flushes_slow_stream_on_deadline(self):
+        """Test buffered audio is flushed without waiting for the next chunk."""
+        from shared_ai_utils.tts.manager import _coalesce_chunks
+
+        async def slow_chunks():
+            yield b"a"
+            await asyncio.sleep(10)
+            yield b"b"
+
+        stream = _coalesce_chunks(slow_chunks())
+        assert await asyncio.wait_for(stream.__anext__(), timeout=1.0) == b"a"
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_list_voices_by_provider(self):
+        """Test listing voices for a named provider."""
+        manager = TTSManager(elevenlabs_api_key="test-key", openai_api_key="test-key")
+
+        voices = await manager.list_voices(provider="openai")
+
+        assert any(voice["id"] == "alloy" for voice in voices)
+
+    @pytest.mark.asyncio
+    async def test_generate_speech_falls_back_on_error(self):
+        """Test the fallback provider is used when the primary raises."""
+        manager = TTSManager(elevenlabs_api_key="test-key", openai_api_key="test-key")
+        manager.primary_provider.generate_speech = AsyncMock(side_effect=Exception("down"))
+        manager.fallback_provider.generate_speech = AsyncMock(return_value=_FAKE_OPENAI_RESPONSE)
+
+        response = await manager.generate_speech("Hello")
+
+        assert response.provider == "openai"
+
+
+class TestCachingTTSMixin:
+    """Test CachingTTSMixin."""
+
+    class CachedOpenAI(CachingTTSMixin, OpenAITTSProvider):
+        pass
+
+    @pytest.mark.asyncio
+    async def test_generate_speech_served_from_cache(self):
+        """Test repeated requests only hit the API once."""
+        provider = self.CachedOpenAI(api_key="test-key")
+        api_response = _FAKE_OPENAI_RESPONSE
+
+        with patch.object(
+            OpenAITTSProvider, "generate_speech", AsyncMock(return_value=api_response)
+        ) as mock_generate:
+            first = await provider.generate_speech("Hello", voice="nova")
+            second = await provider.generate_speech("Hello", voice="nova")
+            other = await provider.generate_speech("Hello", voice="echo")
+
+        assert first.audio_data == second.audio_data == other.audio_data == b"audio"
+        assert mock_generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_speech_replays_cache(self, tmp_path):
+        """Test streamed audio is cached to disk and replayed on the next request."""
+        provider = self.CachedOpenAI(api_key="test-key", cache_dir=tmp_path)
+        api_response = TTSResponse(audio_data=b"streamed", format="mp3", provider="openai")
+
+        with patch.object(
+            OpenAITTSProvider, "generate_speech", AsyncMock(return_value=api_response)
+        ) as mock_generate:
+            first = [chunk async for chunk in provider.stream_speech("Hello")]
+            # A fresh provider only has the on-disk copy
+            restarted = self.CachedOpenAI(api_key="test-key", cache_dir=tmp_path)
+            second = [chunk async for chunk in restarted.stream_speech("Hello")]
+
+        assert b"".join(first) == b"".join(second) == b"streamed"
+        assert mock_generate.await_count == 1
+        assert len(list(tmp_path.glob("*.mp3"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_speech_forwards_chunk_size(self):
+        """Test chunk_size reaches the provider and shapes cached replays."""
+        provider = self.CachedOpenAI(api_key="test-key")
+        api_response = TTSResponse(audio_data=b"abcdefg", format="mp3", provider="openai")
+
+        with patch.object(
+            OpenAITTSProvider, "generate_speech", AsyncMock(return_value=api_response)
+        ):
+            first = [chunk async for chunk in provider.stream_speech("Hi", chunk_size=3)]
+            replay = [chunk async for chunk in provider.stream_speech("Hi", chunk_size=3)]
+            whole = [chunk async for chunk in provider.stream_speech("Hi", chunk_size=0)]
+
+        assert first == replay == [b"abc", b"def", b"g"]
+        assert whole == [b"abcdefg"]
+
+    @pytest.mark.asyncio
+    async def test_cached_metadata_not_shared(self):
+        """Test mutating a returned response does not change later cache hits."""
+        provider = self.CachedOpenAI(api_key="test-key")
+        api_response = TTSResponse(
+            audio_data=b"audio", format="mp3", provider="openai", metadata={"voice": "nova"}
+        )
+
+        with patch.object(
+            OpenAITTSProvider, "generate_speech", AsyncMock(return_value=api_response)
+        ):
+            first = await provider.generate_speech("Hello")
+            first.metadata["voice"] = "mutated"
+            second = await provider.generate_speech("Hello")
+            second.metadata["extra"] = True
+            third = await provider.generate_speech("Hello")
+
+        assert third.metadata == {"voice": "nova"}